@@ -6,42 +6,100 @@ A clean interface that combines menu-driven simplicity with arrow key navigation
 for managing Model Context Protocol (MCP) server configurations across multiple applications.
 """
 
+import functools
+import hashlib
 import json
 import os
 import sys
-import termios
-import tty
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-from rich.console import Console
+from rich.console import Console, Group
+from rich.live import Live
 from rich.panel import Panel
 from rich.table import Table
 from rich.prompt import Prompt, Confirm
 from rich.text import Text
-from rich import box
-from rich.align import Align
 
-from mcp_core import MCPConfigSynchronizer
+from mcp_core import MCPConfigSynchronizer, StandardMCPHandler
 
+# Key lookup tables: dict hashing in C instead of chained comparisons on the
+# raw-mode input path
+_ESC_SEQ_MAP = {'\x1b[A': 'up', '\x1b[B': 'down', '\x1b[C': 'right', '\x1b[D': 'left'}
+_KEY_MAP = {'\r': 'enter', '\n': 'enter', '\x03': 'ctrl_c', 'q': 'quit', 'Q': 'quit'}
+_WIN_ARROW_MAP = {b'H': 'up', b'P': 'down', b'K': 'left', b'M': 'right'}
+_WIN_KEY_MAP = {b'\r': 'enter', b'\x1b': 'escape', b'q': 'quit', b'Q': 'quit'}
 
-@dataclass
+_STANDARD_HANDLER = StandardMCPHandler()
+
+
+@functools.lru_cache(maxsize=1)
+def _box():
+    """Deferred rich.box import; only TUI renders pay for it."""
+    from rich import box
+    return box.ROUNDED
+
+
+def _short_join(args: List[str], limit: int = 30) -> str:
+    """Join args for display, stopping as soon as the limit is exceeded.
+
+    Avoids materializing the full joined string for long argument lists
+    only to slice most of it away on every table redraw.
+    """
+    buf = []
+    n = 0
+    for arg in args:
+        buf.append(arg)
+        n += len(arg) + 1
+        if n > limit:
+            return ' '.join(buf)[:limit] + "..."
+    return ' '.join(buf) or "—"
+
+
+@functools.lru_cache(maxsize=1)
+def _header_title():
+    """Deferred rich.align import for the one centered header line."""
+    from rich.align import Align
+    return Align.center(Text("🔧 MCP Configuration Manager", style="bold blue"))
+
+
+@functools.lru_cache(maxsize=16)
+def _handler_for(app_name: str):
+    """Look up the format handler for an application.
+
+    The app-to-handler mapping is fixed for the life of the process, so the
+    dispatch is memoized instead of hitting APP_HANDLERS on every save.
+    """
+    return MCPConfigSynchronizer.APP_HANDLERS.get(app_name, _STANDARD_HANDLER)
+
+
+@dataclass(slots=True)
 class MCPServer:
     """Data class representing an MCP server configuration."""
     name: str
     command: str
     args: List[str]
     env: Dict[str, str]
+    _cached: Optional[Dict[str, Any]] = field(default=None, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        # Field mutation invalidates the cached serialized form
+        if name == 'command' or name == 'args' or name == 'env':
+            object.__setattr__(self, '_cached', None)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary format for JSON serialization."""
-        result = {"command": self.command}
-        if self.args:
-            result["args"] = self.args
-        if self.env:
-            result["env"] = self.env
-        return result
+        if self._cached is None:
+            result = {"command": self.command}
+            if self.args:
+                result["args"] = self.args
+            if self.env:
+                result["env"] = self.env
+            self._cached = result
+        return self._cached
 
     @classmethod
     def from_dict(cls, name: str, data: Dict[str, Any]) -> 'MCPServer':
@@ -62,7 +120,22 @@ class MCPConfigurationManager:
         self.synchronizer = MCPConfigSynchronizer()
         self.current_app = "Claude"
         self.current_servers: Dict[str, MCPServer] = {}
+        # Raw dict mirror of current_servers, kept in step per-server so saves
+        # don't rebuild every entry via to_dict
+        self._raw_servers: Dict[str, Dict[str, Any]] = {}
         self.running = True
+        # Cache of parsed configs keyed by path: (mtime_ns, size, servers)
+        self._config_cache: Dict[Path, tuple] = {}
+        # Parsed configs keyed by content digest, so a touched-but-unchanged
+        # file skips the JSON parse entirely
+        self._digest_cache: Dict[Path, tuple] = {}
+        # Detected format handler per path, valid as long as the digest entry
+        # above is; cleared whenever the file's content changes
+        self._detect_cache: Dict[Path, Any] = {}
+        # App list is fixed for the life of the manager; existence is re-stated
+        # only on refresh and after saves
+        self._apps = tuple(self.synchronizer.CONFIG_FILES.keys())
+        self._app_exists = {app: path.exists() for app, path in self.synchronizer.CONFIG_FILES.items()}
         
         # Menu options
         self.main_menu_options = [
@@ -76,228 +149,397 @@ class MCPConfigurationManager:
             "Quit"
         ]
         self.current_selection = 0
-        
+
+        # Pre-render the menu rows once; only the selected row differs per frame
+        self._menu_rows = []
+        self._menu_rows_highlighted = []
+        for i, option in enumerate(self.main_menu_options):
+            normal_style = "red" if option == "Quit" else "white"
+            highlight_style = "bold red on white" if option == "Quit" else "bold blue on white"
+            self._menu_rows.append(
+                Text.from_markup(f"   [color(240)]{i+1}.[/color(240)] [{normal_style}]{option}[/{normal_style}]"))
+            self._menu_rows_highlighted.append(
+                Text.from_markup(f"👉 [color(240)]{i+1}.[/color(240)] [{highlight_style}]{option}[/{highlight_style}]"))
+        self._menu_title = Text.from_markup(
+            "[bold white]Main Menu (↑↓ to navigate, Enter to select, Q to quit):[/bold white]")
+        self._menu_hint = Text("Use ↑↓ arrows to navigate, Enter to select, Q to quit", style="dim")
+
+        # Static renderables built once so repeated prints skip markup parsing
+        self._header_panel = Panel(
+            _header_title(),
+            title="MCP Configuration Manager",
+            border_style="blue",
+            padding=(1, 2)
+        )
+        self._select_hint = Text("↑↓ to navigate, Enter to select, Esc to cancel", style="dim")
+        self._select_hint_no_cancel = Text("↑↓ to navigate, Enter to select", style="dim")
+        self._multi_select_hint = Text(
+            "↑↓ to navigate, Space to toggle, Enter to confirm, Esc to cancel", style="dim")
+        self._no_servers_text = Text("No servers configured for this application.", style="dim")
+        # Plain-cell console for the overview table: skipping the regex
+        # highlighter is the single biggest per-cell render cost
+        self._plain_console = Console(highlight=False)
+        # Overview column definitions, built once; a live Table can't be
+        # reused across renders because Rich columns own their cells
+        self._overview_columns = (
+            ("Application", {"style": "cyan", "no_wrap": True}),
+            ("Server Name", {"style": "green", "no_wrap": True}),
+            ("Command", {"style": "white", "no_wrap": True}),
+            ("Arguments", {"style": "yellow", "no_wrap": True}),
+            ("Environment", {"style": "blue", "no_wrap": True}),
+            ("Status", {"justify": "center"}),
+        )
+
+        if os.name == 'nt':
+            # Enable ANSI escape handling on Windows consoles
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetConsoleMode(kernel32.GetStdHandle(-11), 7)
+
     def clear_screen(self):
-        """Clear the terminal screen."""
-        os.system('clear' if os.name == 'posix' else 'cls')
+        """Clear the terminal screen with an ANSI escape (no subprocess fork)."""
+        sys.stdout.write("\x1b[H\x1b[2J\x1b[3J" if os.name == 'posix' else "\x1b[H\x1b[2J")
+        sys.stdout.flush()
     
-    def get_key(self):
-        """Get a single keypress from the user."""
+    def _get_key_windows(self):
+        """Read a single keypress on Windows."""
+        import msvcrt
+        key = msvcrt.getch()
+        if key == b'\xe0':  # Arrow key prefix on Windows
+            key = msvcrt.getch()
+            arrow = _WIN_ARROW_MAP.get(key)
+            if arrow:
+                return arrow
+        else:
+            mapped = _WIN_KEY_MAP.get(key)
+            if mapped:
+                return mapped
+        return key.decode('utf-8', errors='ignore')
+
+    def _parse_key_buffer(self, buf: str) -> List[str]:
+        """Parse a raw-mode input buffer into a list of key events."""
+        keys = []
+        i = 0
+        n = len(buf)
+        while i < n:
+            ch = buf[i]
+            if ch == '\x1b':  # ESC sequence
+                mapped = _ESC_SEQ_MAP.get(buf[i:i + 3])
+                if mapped:
+                    keys.append(mapped)
+                    i += 3
+                    continue
+                keys.append('escape')
+            else:
+                keys.append(_KEY_MAP.get(ch, ch))
+            i += 1
+        return keys
+
+    def get_keys(self) -> List[str]:
+        """Block for one keypress, then drain any queued input.
+
+        A held-down arrow key queues autorepeat bytes faster than the menu
+        can redraw; draining them here lets the caller apply the whole burst
+        before repainting once instead of once per repeat.
+        """
         if os.name == 'nt':  # Windows
             import msvcrt
-            key = msvcrt.getch()
-            if key == b'\xe0':  # Arrow key prefix on Windows
-                key = msvcrt.getch()
-                if key == b'H': return 'up'
-                elif key == b'P': return 'down'
-                elif key == b'K': return 'left'
-                elif key == b'M': return 'right'
-            elif key == b'\r': return 'enter'
-            elif key == b'\x1b': return 'escape'
-            elif key == b'q' or key == b'Q': return 'quit'
-            return key.decode('utf-8', errors='ignore')
+            keys = [self._get_key_windows()]
+            while msvcrt.kbhit():
+                keys.append(self._get_key_windows())
+            return keys
         else:  # Unix/Linux/Mac
+            # Deferred so importing this module stays cheap (and possible on
+            # Windows) for code paths that never enter raw-mode input
+            import select
+            import termios
+            import tty
             fd = sys.stdin.fileno()
             old_settings = termios.tcgetattr(fd)
             try:
                 tty.setraw(fd)
-                key = sys.stdin.read(1)
-                if key == '\x1b':  # ESC sequence
-                    key += sys.stdin.read(2)
-                    if key == '\x1b[A': return 'up'
-                    elif key == '\x1b[B': return 'down'
-                    elif key == '\x1b[C': return 'right'
-                    elif key == '\x1b[D': return 'left'
-                    else: return 'escape'
-                elif key == '\r' or key == '\n': return 'enter'
-                elif key == '\x03': return 'ctrl_c'
-                elif key == 'q' or key == 'Q': return 'quit'
-                return key
+                # Read the fd directly: sys.stdin's buffering would slurp
+                # queued bytes into a Python-level buffer that select()
+                # cannot see, defeating both drains below
+                data = os.read(fd, 1024)
+                while select.select([fd], [], [], 0)[0]:
+                    data += os.read(fd, 1024)
+                # A trailing bare ESC may be the start of an arrow-key
+                # sequence whose continuation bytes haven't arrived yet
+                # (laggy terminals split the write); give them a short
+                # grace period before reporting a real Escape press
+                while data[-1:] == b'\x1b' or data[-2:] == b'\x1b[':
+                    if not select.select([fd], [], [], 0.03)[0]:
+                        break
+                    data += os.read(fd, 1024)
+                buf = data.decode('utf-8', errors='ignore')
             finally:
                 termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+            return self._parse_key_buffer(buf)
+
+    def get_key(self):
+        """Get a single keypress from the user."""
+        return self.get_keys()[0]
     
+    def render_header(self):
+        """Return the prebuilt application header renderable."""
+        return self._header_panel
+
     def show_header(self):
         """Display the application header."""
-        header_text = Text("🔧 MCP Configuration Manager", style="bold blue")
-        header_panel = Panel(
-            Align.center(header_text),
-            title="MCP Configuration Manager",
-            border_style="blue",
-            padding=(1, 2)
-        )
-        self.console.print(header_panel)
+        self.console.print(self.render_header())
         self.console.print()
-    
-    def show_current_app_info(self):
-        """Display current application and server count."""
+
+    def render_current_app_info(self):
+        """Build the current application/server count renderable."""
         server_count = len(self.current_servers)
         info_text = f"📱 Current App: [bold cyan]{self.current_app}[/bold cyan]  |  🔧 Servers: [bold yellow]{server_count}[/bold yellow]"
-        
-        info_panel = Panel(
+
+        return Panel(
             info_text,
             border_style="green",
             padding=(0, 2)
         )
-        self.console.print(info_panel)
-        self.console.print()
-    
-    def show_servers_table(self):
-        """Display current servers in a table."""
+
+    def render_servers_table(self):
+        """Build the current servers table renderable."""
         if not self.current_servers:
-            self.console.print("[dim]No servers configured for this application.[/dim]")
-            self.console.print()
-            return
-        
+            return self._no_servers_text
+
         table = Table(
             title=f"MCP Servers for {self.current_app}",
-            box=box.ROUNDED,
+            box=_box(),
             title_style="bold magenta"
         )
         table.add_column("Name", style="cyan", no_wrap=True)
         table.add_column("Command", style="white")
         table.add_column("Arguments", style="yellow")
         table.add_column("Environment", style="green")
-        
+
         for server in self.current_servers.values():
-            args_display = " ".join(server.args) if server.args else "—"
             env_display = f"{len(server.env)} vars" if server.env else "—"
-            
+
             table.add_row(
                 server.name,
                 server.command,
-                args_display[:30] + ("..." if len(args_display) > 30 else ""),
+                _short_join(server.args),
                 env_display
             )
-        
-        self.console.print(table)
-        self.console.print()
-    
-    def show_main_menu(self):
-        """Display the main menu with arrow key navigation."""
-        self.console.print("[bold white]Main Menu (↑↓ to navigate, Enter to select, Q to quit):[/bold white]")
-        self.console.print()
-        
-        for i, option in enumerate(self.main_menu_options):
-            if i == self.current_selection:
-                # Highlighted option
-                if option == "Quit":
-                    style = "bold red on white"
-                    pointer = "👉"
-                else:
-                    style = "bold blue on white"
-                    pointer = "👉"
-                self.console.print(f"{pointer} [color(240)]{i+1}.[/color(240)] [{style}]{option}[/{style}]")
-            else:
-                # Regular option
-                if option == "Quit":
-                    style = "red"
-                else:
-                    style = "white"
-                self.console.print(f"   [color(240)]{i+1}.[/color(240)] [{style}]{option}[/{style}]")
-        
-        self.console.print()
-        self.console.print("[dim]Use ↑↓ arrows to navigate, Enter to select, Q to quit[/dim]")
-    
+
+        return table
+
+    def render_main_menu(self):
+        """Build the main menu renderable with the current selection highlighted."""
+        rows = (self._menu_rows_highlighted[i] if i == self.current_selection else self._menu_rows[i]
+                for i in range(len(self.main_menu_options)))
+        return Group(self._menu_title, Text(), *rows, Text(), self._menu_hint)
+
     def navigate_menu(self):
         """Handle arrow key navigation for the main menu."""
-        while True:
-            self.clear_screen()
-            self.show_header()
-            self.show_current_app_info()
-            self.show_servers_table()
-            self.show_main_menu()
-            
-            try:
-                key = self.get_key()
-                
-                if key == 'up':
-                    self.current_selection = (self.current_selection - 1) % len(self.main_menu_options)
-                elif key == 'down':
-                    self.current_selection = (self.current_selection + 1) % len(self.main_menu_options)
-                elif key == 'enter':
-                    return self.current_selection
-                elif key == 'quit' or key == 'escape':
-                    return len(self.main_menu_options) - 1  # Quit option
-                elif key == 'ctrl_c':
-                    raise KeyboardInterrupt
-                elif key.isdigit():
-                    # Allow direct number selection
-                    num = int(key) - 1
-                    if 0 <= num < len(self.main_menu_options):
-                        self.current_selection = num
-                        return self.current_selection
-                        
-            except KeyboardInterrupt:
-                return len(self.main_menu_options) - 1  # Quit
-    
+        with Live(console=self.console, screen=True, auto_refresh=False) as live:
+            while True:
+                live.update(Group(
+                    self.render_header(),
+                    self.render_current_app_info(),
+                    self.render_servers_table(),
+                    Text(),
+                    self.render_main_menu()
+                ))
+                live.refresh()
+
+                try:
+                    # Apply the whole input burst before the next repaint
+                    for key in self.get_keys():
+                        if key == 'up':
+                            self.current_selection = (self.current_selection - 1) % len(self.main_menu_options)
+                        elif key == 'down':
+                            self.current_selection = (self.current_selection + 1) % len(self.main_menu_options)
+                        elif key == 'enter':
+                            return self.current_selection
+                        elif key == 'quit' or key == 'escape':
+                            return len(self.main_menu_options) - 1  # Quit option
+                        elif key == 'ctrl_c':
+                            raise KeyboardInterrupt
+                        elif key.isdigit():
+                            # Allow direct number selection
+                            num = int(key) - 1
+                            if 0 <= num < len(self.main_menu_options):
+                                self.current_selection = num
+                                return self.current_selection
+
+                except KeyboardInterrupt:
+                    return len(self.main_menu_options) - 1  # Quit
+
     def arrow_select_from_list(self, items: List[str], title: str, allow_cancel: bool = True) -> Optional[int]:
         """Generic arrow key selection from a list."""
         if not items:
             return None
-            
+
         selection = 0
-        
-        while True:
-            self.clear_screen()
-            self.show_header()
-            
-            self.console.print(f"[bold blue]{title}[/bold blue]")
-            self.console.print()
-            
-            for i, item in enumerate(items):
-                if i == selection:
-                    self.console.print(f"👉 [{i+1}] [bold blue on white]{item}[/bold blue on white]")
-                else:
-                    self.console.print(f"   [{i+1}] {item}")
-            
-            if allow_cancel:
-                self.console.print()
-                self.console.print("[dim]↑↓ to navigate, Enter to select, Esc to cancel[/dim]")
-            else:
-                self.console.print()
-                self.console.print("[dim]↑↓ to navigate, Enter to select[/dim]")
-            
-            try:
-                key = self.get_key()
-                
-                if key == 'up':
-                    selection = (selection - 1) % len(items)
-                elif key == 'down':
-                    selection = (selection + 1) % len(items)
-                elif key == 'enter':
-                    return selection
-                elif key == 'escape' and allow_cancel:
-                    return None
-                elif key == 'ctrl_c':
-                    raise KeyboardInterrupt
-                elif key.isdigit():
-                    num = int(key) - 1
-                    if 0 <= num < len(items):
-                        return num
-                        
-            except KeyboardInterrupt:
-                if allow_cancel:
-                    return None
-                raise
+        hint = self._select_hint if allow_cancel else self._select_hint_no_cancel
+
+        with Live(console=self.console, screen=True, auto_refresh=False) as live:
+            while True:
+                lines = [Text.from_markup(f"[bold blue]{title}[/bold blue]"), Text()]
+                for i, item in enumerate(items):
+                    if i == selection:
+                        lines.append(Text.from_markup(f"👉 [{i+1}] [bold blue on white]{item}[/bold blue on white]"))
+                    else:
+                        lines.append(Text(f"   [{i+1}] {item}"))
+                lines.append(Text())
+                lines.append(hint)
+
+                live.update(Group(self.render_header(), Text(), *lines))
+                live.refresh()
+
+                try:
+                    # Apply the whole input burst before the next repaint
+                    for key in self.get_keys():
+                        if key == 'up':
+                            selection = (selection - 1) % len(items)
+                        elif key == 'down':
+                            selection = (selection + 1) % len(items)
+                        elif key == 'enter':
+                            return selection
+                        elif key == 'escape' and allow_cancel:
+                            return None
+                        elif key == 'ctrl_c':
+                            raise KeyboardInterrupt
+                        elif key.isdigit():
+                            num = int(key) - 1
+                            if 0 <= num < len(items):
+                                return num
+
+                except KeyboardInterrupt:
+                    if allow_cancel:
+                        return None
+                    raise
     
+    def arrow_multi_select_from_list(self, items: List[str], title: str,
+                                     preselected: Optional[List[str]] = None) -> Optional[List[str]]:
+        """Generic arrow key multi-selection from a list.
+
+        Space toggles the highlighted item, Enter confirms the selection,
+        Esc cancels. Returns the selected items in list order, or None on
+        cancel.
+        """
+        if not items:
+            return None
+
+        cursor = 0
+        selected = set(items if preselected is None else preselected)
+
+        with Live(console=self.console, screen=True, auto_refresh=False) as live:
+            while True:
+                lines = [Text.from_markup(f"[bold blue]{title}[/bold blue]"), Text()]
+                for i, item in enumerate(items):
+                    mark = "x" if item in selected else " "
+                    if i == cursor:
+                        lines.append(Text.from_markup(f"👉 [{mark}] [bold blue on white]{item}[/bold blue on white]"))
+                    else:
+                        lines.append(Text(f"   [{mark}] {item}"))
+                lines.append(Text())
+                lines.append(self._multi_select_hint)
+
+                live.update(Group(self.render_header(), Text(), *lines))
+                live.refresh()
+
+                try:
+                    for key in self.get_keys():
+                        if key == 'up':
+                            cursor = (cursor - 1) % len(items)
+                        elif key == 'down':
+                            cursor = (cursor + 1) % len(items)
+                        elif key == ' ':
+                            selected ^= {items[cursor]}
+                        elif key == 'enter':
+                            return [item for item in items if item in selected]
+                        elif key == 'escape':
+                            return None
+                        elif key == 'ctrl_c':
+                            raise KeyboardInterrupt
+
+                except KeyboardInterrupt:
+                    return None
+
+    def _load_if_changed(self, config_path: Path) -> Optional[Dict[str, Any]]:
+        """Load a config file, reusing the parsed dict when its bytes are unchanged.
+
+        Hashing the raw bytes (BLAKE2b) is far cheaper than json.loads, so a
+        file whose mtime moved but whose content did not costs one read plus a
+        digest compare. Returns None when the file is missing or unparsable.
+        """
+        try:
+            raw = config_path.read_bytes()
+        except OSError:
+            self._digest_cache.pop(config_path, None)
+            return None
+
+        digest = hashlib.blake2b(raw, digest_size=16).digest()
+        cached = self._digest_cache.get(config_path)
+        if cached and cached[0] == digest:
+            return cached[1]
+
+        try:
+            parsed = json.loads(raw)
+        except json.JSONDecodeError:
+            return None
+
+        self._digest_cache[config_path] = (digest, parsed)
+        self._detect_cache.pop(config_path, None)
+        return parsed
+
+    def _detect_handler(self, config_path: Path, config: dict):
+        """Detect the format handler for a parsed config, memoized per path.
+
+        Format detection walks the handler priority list on every call; the
+        result only changes when the file's content does, so it is cached
+        alongside the digest cache and invalidated together with it.
+        """
+        handler = self._detect_cache.get(config_path)
+        if handler is None:
+            handler = self.synchronizer.detect_config_format(config)
+            self._detect_cache[config_path] = handler
+        return handler
+
+    def _refresh_existence(self):
+        """Re-check which application config files exist on disk."""
+        self._app_exists = {app: path.exists() for app, path in self.synchronizer.CONFIG_FILES.items()}
+
     def load_current_servers(self):
         """Load servers for the currently selected application."""
         self.current_servers = {}
-        
+        self._raw_servers = {}
+
         config_path = self.synchronizer.CONFIG_FILES[self.current_app]
-        if not config_path.exists():
+        try:
+            stat = os.stat(config_path)
+        except OSError:
             return
-        
-        config = self.synchronizer.load_existing_config(config_path)
+
+        # Reuse the parsed servers when the file on disk hasn't changed
+        cached = self._config_cache.get(config_path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            self.current_servers = dict(cached[2])
+            self._raw_servers = dict(cached[3])
+            return
+
+        config = self._load_if_changed(config_path)
         if not config:
             return
-        
-        handler = self.synchronizer.detect_config_format(config)
+
+        handler = self._detect_handler(config_path, config)
         mcp_config = handler.extract_mcp_config(config)
-        
+
         servers = mcp_config.get('servers', {})
         for name, server_data in servers.items():
             self.current_servers[name] = MCPServer.from_dict(name, server_data)
+        # The parsed server dicts already have the on-disk shape; reuse them
+        # rather than round-tripping through to_dict
+        self._raw_servers = dict(servers)
+
+        self._config_cache[config_path] = (
+            stat.st_mtime_ns, stat.st_size, dict(self.current_servers), dict(self._raw_servers))
     
     def save_current_servers(self):
         """Save current servers back to the application's config file."""
@@ -307,24 +549,33 @@ class MCPConfigurationManager:
         existing_config = self.synchronizer.load_existing_config(config_path) or {}
         
         # Get appropriate handler
-        handler = self.synchronizer.get_app_handler(self.current_app)
+        handler = _handler_for(self.current_app)
         
-        # Build MCP config
+        # Build MCP config from the maintained raw mirror
         mcp_config = {
-            "servers": {name: server.to_dict() for name, server in self.current_servers.items()}
+            "servers": dict(self._raw_servers)
         }
         
         # Merge with existing config
         updated_config = handler.merge_mcp_config(existing_config, mcp_config)
         
-        # Save to file
+        # Serialize once and write atomically: a single write_bytes instead of
+        # json.dump's many small writes, and os.replace so readers never see a
+        # torn file. ensure_ascii=False keeps non-ASCII env values as UTF-8.
         config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(config_path, 'w') as f:
-            json.dump(updated_config, f, indent=2)
+        data = json.dumps(updated_config, indent=2, ensure_ascii=False).encode('utf-8')
+        tmp_path = config_path.with_suffix(config_path.suffix + '.tmp')
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, config_path)
+
+        # Invalidate the cached parse for this path so the next load re-reads
+        self._config_cache.pop(config_path, None)
+        self._detect_cache.pop(config_path, None)
+        self._refresh_existence()
     
     def switch_application(self):
         """Switch to a different application using arrow navigation."""
-        apps = list(self.synchronizer.CONFIG_FILES.keys())
+        apps = self._apps
         current_index = apps.index(self.current_app) if self.current_app in apps else 0
         
         # Show current selection first
@@ -428,19 +679,17 @@ class MCPConfigurationManager:
             # 3. "server_name": {"command": "...", "args": [...]} (partial from README)
             
             if len(server_data) == 1:
-                key = list(server_data.keys())[0]
-                value = server_data[key]
-                
-                if isinstance(value, dict) and 'command' in value:
-                    # Format 1 or 3: {"server_name": {config}}
-                    server_name = key
-                    config = value
-                elif 'command' in server_data:
-                    # Format 2: just the config object
-                    server_name = Prompt.ask("Server name")
-                    config = server_data
-                else:
-                    raise ValueError("Invalid server configuration format")
+                # Format 1 or 3 is the common case: {"server_name": {config}}
+                server_name = next(iter(server_data))
+                config = server_data[server_name]
+
+                if not (isinstance(config, dict) and 'command' in config):
+                    if 'command' in server_data:
+                        # Format 2: just the config object
+                        server_name = Prompt.ask("Server name")
+                        config = server_data
+                    else:
+                        raise ValueError("Invalid server configuration format")
             elif 'command' in server_data:
                 # Format 2: {"command": "...", "args": [...], "env": {...}}
                 server_name = Prompt.ask("Server name")
@@ -475,6 +724,7 @@ class MCPConfigurationManager:
             # Create and save server
             server = MCPServer(name=server_name, command=command, args=args, env=env)
             self.current_servers[server_name] = server
+            self._raw_servers[server_name] = server.to_dict()
             self.save_current_servers()
             
             self.console.print(f"✅ Server '[bold cyan]{server_name}[/bold cyan]' added successfully")
@@ -544,6 +794,7 @@ class MCPConfigurationManager:
             server.command = new_command
             server.args = new_args
             server.env = new_env
+            self._raw_servers[server_name] = server.to_dict()
             
             self.save_current_servers()
             self.console.print(f"✅ Server '[bold cyan]{server_name}[/bold cyan]' updated successfully")
@@ -579,6 +830,7 @@ class MCPConfigurationManager:
         self.show_header()
         if Confirm.ask(f"Are you sure you want to delete '[bold red]{server_name}[/bold red]'?"):
             del self.current_servers[server_name]
+            self._raw_servers.pop(server_name, None)
             self.save_current_servers()
             self.console.print(f"✅ Server '[bold red]{server_name}[/bold red]' deleted successfully")
         else:
@@ -597,35 +849,12 @@ class MCPConfigurationManager:
             return
         
         # First, select which servers to sync
-        self.clear_screen()
-        self.show_header()
-        self.console.print(f"[bold blue]Select MCP Servers to Sync[/bold blue]")
-        self.console.print()
-        self.console.print(f"Source: [bold cyan]{self.current_app}[/bold cyan]")
-        self.console.print()
-        
         server_names = list(self.current_servers.keys())
-        selected_servers = []
-        
-        # Use checkboxes for server selection
-        for server_name in server_names:
-            self.clear_screen()
-            self.show_header()
-            self.console.print(f"[bold blue]Select MCP Servers to Sync[/bold blue]")
-            self.console.print()
-            self.console.print(f"Source: [bold cyan]{self.current_app}[/bold cyan]")
-            self.console.print()
-            
-            # Show already selected servers
-            if selected_servers:
-                self.console.print("[bold green]Selected servers:[/bold green]")
-                for selected in selected_servers:
-                    self.console.print(f"  ✅ [green]{selected}[/green]")
-                self.console.print()
-            
-            if Confirm.ask(f"Include [bold yellow]{server_name}[/bold yellow]?", default=True):
-                selected_servers.append(server_name)
-        
+        selected_servers = self.arrow_multi_select_from_list(
+            server_names,
+            f"📦 Select MCP Servers to Sync (source: {self.current_app})"
+        )
+
         if not selected_servers:
             self.clear_screen()
             self.show_header()
@@ -633,41 +862,15 @@ class MCPConfigurationManager:
             input("Press Enter to continue...")
             return
         
-        # Confirm selected servers
-        self.clear_screen()
-        self.show_header()
-        self.console.print(f"[bold blue]Confirm Selected Servers[/bold blue]")
-        self.console.print()
-        self.console.print(f"Source: [bold cyan]{self.current_app}[/bold cyan]")
-        self.console.print()
-        self.console.print("[bold white]Servers to sync:[/bold white]")
-        for i, server_name in enumerate(selected_servers, 1):
-            self.console.print(f"  {i}. [green]{server_name}[/green]")
-        self.console.print()
-        
-        if not Confirm.ask(f"Use these [bold yellow]{len(selected_servers)}[/bold yellow] servers from [bold cyan]{self.current_app}[/bold cyan] as the source?", default=True):
-            self.console.print("[yellow]Sync cancelled[/yellow]")
-            self.console.print()
-            input("Press Enter to continue...")
-            return
-        
+        # The multi-select above already carries the selection intent; go
+        # straight to target selection and keep a single final confirmation
         # Get other apps (excluding current app)
-        apps = [app for app in self.synchronizer.CONFIG_FILES.keys() if app != self.current_app]
-        selected_apps = []
-        
-        # Use arrow navigation for each app
-        for app in apps:
-            self.clear_screen()
-            self.show_header()
-            self.console.print(f"[bold blue]Select Target Applications[/bold blue]")
-            self.console.print()
-            self.console.print(f"Source: [bold cyan]{self.current_app}[/bold cyan] → Target: [bold yellow]{app}[/bold yellow]")
-            self.console.print(f"Servers: [bold white]{', '.join(selected_servers)}[/bold white]")
-            self.console.print()
-            
-            if Confirm.ask(f"Sync to [bold yellow]{app}[/bold yellow]?", default=True):
-                selected_apps.append(app)
-        
+        apps = [app for app in self._apps if app != self.current_app]
+        selected_apps = self.arrow_multi_select_from_list(
+            apps,
+            f"📱 Select Target Applications (source: {self.current_app})"
+        )
+
         if not selected_apps:
             self.clear_screen()
             self.show_header()
@@ -701,7 +904,10 @@ class MCPConfigurationManager:
         
         self.synchronizer.config = sync_config
         sync_results = self.synchronizer.update_configs()
-        
+        # The sync can create config files that were missing before, so
+        # the cached existence map needs a refresh
+        self._refresh_existence()
+
         # Count results for selected apps only
         success_count = sum(1 for app in selected_apps if sync_results.get(app, {}).get('success', False))
         
@@ -722,7 +928,7 @@ class MCPConfigurationManager:
         
         table = Table(
             title="📊 Application Status",
-            box=box.ROUNDED,
+            box=_box(),
             show_header=True,
             title_style="bold blue"
         )
@@ -730,17 +936,26 @@ class MCPConfigurationManager:
         table.add_column("Status", justify="center")
         table.add_column("Servers", justify="right")
         table.add_column("Format", style="dim")
-        
-        for app_name, config_path in self.synchronizer.CONFIG_FILES.items():
-            if config_path.exists():
+
+        # Load all configs concurrently; the reads release the GIL so wall
+        # time is roughly the slowest file instead of the sum
+        config_files = self.synchronizer.CONFIG_FILES
+        with ThreadPoolExecutor(max_workers=min(8, max(len(config_files), 1))) as executor:
+            configs = dict(zip(
+                config_files.keys(),
+                executor.map(self._load_if_changed, config_files.values())
+            ))
+
+        for app_name, config_path in config_files.items():
+            if self._app_exists.get(app_name):
                 validation = validation_results.get(app_name, {})
                 in_sync = validation.get('in_sync', False)
                 format_name = validation.get('format', 'Unknown')
-                
+
                 # Count servers
-                config = self.synchronizer.load_existing_config(config_path)
+                config = configs.get(app_name)
                 if config:
-                    handler = self.synchronizer.detect_config_format(config)
+                    handler = self._detect_handler(config_path, config)
                     mcp_config = handler.extract_mcp_config(config)
                     server_count = len(mcp_config.get('servers', {}))
                 else:
@@ -763,28 +978,18 @@ class MCPConfigurationManager:
         self.console.print("[bold blue]🔍 MCP Server Overview - All Applications[/bold blue]")
         self.console.print()
         
-        # Create a comprehensive table
-        table = Table(
-            title="MCP Servers Across All Applications",
-            box=box.ROUNDED,
-            show_header=True,
-            title_style="bold magenta"
-        )
-        table.add_column("Application", style="cyan", no_wrap=True)
-        table.add_column("Server Name", style="green", no_wrap=True)
-        table.add_column("Command", style="white")
-        table.add_column("Arguments", style="yellow")
-        table.add_column("Environment", style="blue")
-        table.add_column("Status", justify="center")
-        
+        # Gather all rows as plain strings first; building the Table after
+        # the data pass keeps Rich's per-row measuring out of the I/O loop
+        rows: List[tuple] = []
         total_servers = 0
         apps_with_servers = 0
         
+        overview_configs = self.synchronizer._load_all()
         for app_name, config_path in self.synchronizer.CONFIG_FILES.items():
-            if config_path.exists():
-                config = self.synchronizer.load_existing_config(config_path)
+            if self._app_exists.get(app_name):
+                config = overview_configs.get(app_name)
                 if config:
-                    handler = self.synchronizer.detect_config_format(config)
+                    handler = self._detect_handler(config_path, config)
                     mcp_config = handler.extract_mcp_config(config)
                     servers = mcp_config.get('servers', {})
                     
@@ -797,31 +1002,32 @@ class MCPConfigurationManager:
                             args = server_data.get('args', [])
                             env = server_data.get('env', {})
                             
-                            args_display = " ".join(args) if args else "—"
-                            if len(args_display) > 25:
-                                args_display = args_display[:22] + "..."
-                            
+                            # limit=22 keeps the truncated form at the
+                            # overview's original 25-char column budget
+                            args_display = _short_join(args, limit=22) if args else "—"
                             env_display = f"{len(env)} vars" if env else "—"
                             
-                            # Determine status
-                            status = "✅ Active"
-                            
-                            table.add_row(
+                            rows.append((
                                 app_name,
                                 server_name,
-                                command[:30] + ("..." if len(command) > 30 else ""),
+                                command if len(command) <= 30 else command[:27] + "...",
                                 args_display,
                                 env_display,
-                                status
-                            )
+                                "✅ Active"
+                            ))
                     else:
-                        table.add_row(app_name, "—", "No servers configured", "—", "—", "⚪ Empty")
+                        rows.append((app_name, "—", "No servers configured", "—", "—", "⚪ Empty"))
                 else:
-                    table.add_row(app_name, "—", "Invalid config", "—", "—", "❌ Error")
+                    rows.append((app_name, "—", "Invalid config", "—", "—", "❌ Error"))
             else:
-                table.add_row(app_name, "—", "Config file missing", "—", "—", "⭕ Missing")
+                rows.append((app_name, "—", "Config file missing", "—", "—", "⭕ Missing"))
         
-        self.console.print(table)
+        # Very large fleets skip Rich entirely: rendering hundreds of table
+        # rows stalls the terminal, so fall back to plain aligned text
+        if len(rows) > 200:
+            self._print_plain_overview(rows)
+        else:
+            self._render_overview_table(rows)
         self.console.print()
         
         # Summary information
@@ -835,22 +1041,67 @@ class MCPConfigurationManager:
         self.console.print(summary_panel)
         self.console.print()
         
-        # Sync status check
-        all_in_sync, validation_results = self.synchronizer.validate_configs()
-        if all_in_sync:
+        # Sync status check: the fast digest path covers the healthy case;
+        # the full validation only runs when a breakdown is actually needed
+        if self.synchronizer.is_all_in_sync():
             self.console.print("✅ [bold green]All applications are synchronized[/bold green]")
         else:
+            _, validation_results = self.synchronizer.validate_configs()
             out_of_sync_apps = [app for app, result in validation_results.items() if not result.get('in_sync', False)]
             self.console.print(f"⚠️ [bold yellow]{len(out_of_sync_apps)} applications are out of sync: {', '.join(out_of_sync_apps)}[/bold yellow]")
         
         self.console.print()
         input("Press Enter to continue...")
 
+    _OVERVIEW_HEADERS = ("Application", "Server Name", "Command", "Arguments", "Environment", "Status")
+
+    def _print_plain_overview(self, rows: List[tuple]):
+        """Plain-text overview for large row counts.
+
+        Formats every line into one buffer with precomputed column widths
+        and emits it in a single write, bypassing Rich's per-cell
+        measure/render pipeline entirely.
+        """
+        widths = [len(h) for h in self._OVERVIEW_HEADERS]
+        for row in rows:
+            for i, cell in enumerate(row):
+                if len(cell) > widths[i]:
+                    widths[i] = len(cell)
+
+        def fmt(row):
+            return "  ".join(cell.ljust(widths[i]) for i, cell in enumerate(row))
+
+        lines = [fmt(self._OVERVIEW_HEADERS), fmt(tuple("-" * w for w in widths))]
+        lines.extend(fmt(row) for row in rows)
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.flush()
+
+    def _render_overview_table(self, rows: List[tuple]):
+        """Render the overview rows through the pretty Rich table."""
+        # Build the table in one batch; cell content is plain text so the
+        # highlight/markup passes are skipped for every cell
+        table = Table(
+            title="MCP Servers Across All Applications",
+            box=_box(),
+            show_header=True,
+            title_style="bold magenta",
+            pad_edge=False,
+            collapse_padding=True
+        )
+        for header, kwargs in self._overview_columns:
+            table.add_column(header, **kwargs)
+        for row in rows:
+            table.add_row(*row)
+        
+        self._plain_console.print(table)
+
     def refresh_data(self):
         """Refresh all data."""
         self.clear_screen()
         self.show_header()
         self.console.print("[bold white]Refreshing data...[/bold white]")
+        self._refresh_existence()
         self.load_current_servers()
         self.console.print("✅ [bold green]Data refreshed[/bold green]")
         self.console.print()
@@ -7,19 +7,21 @@ functionality for managing Model Context Protocol (MCP) server configurations
 across multiple applications.
 """
 
+import hashlib
 import json
 import os
+from copy import deepcopy
+from types import MappingProxyType
 from pathlib import Path
 import logging
-from datetime import datetime
 import sys
 import time
 import signal
 import threading
 from abc import ABC, abstractmethod
-from watchdog.observers import Observer
+from concurrent.futures import ThreadPoolExecutor
 from watchdog.events import FileSystemEventHandler
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
@@ -31,12 +33,45 @@ from rich import box
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Prefer orjson for config (de)serialization when available; it is a native
+# implementation several times faster than stdlib json on both paths. The
+# fallbacks keep identical on-disk output (2-space indent, UTF-8 bytes).
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _canonical_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+except ImportError:
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+    def _canonical_dumps(obj):
+        return json.dumps(obj, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
 # Configure Rich console
 console = Console()
 
+# Reused empty-dict sentinel for report lookups
+_EMPTY = {}
+
+# Shared pool for fanning out config file I/O; threads are created lazily on
+# first use, and reads release the GIL so loads overlap
+_io_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="mcp-config-io")
+
 class ConfigFormatHandler(ABC):
     """Abstract base class for handling different MCP configuration formats."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def detect_format(self, config_data: dict) -> bool:
         """Detect if this handler can process the given configuration format."""
@@ -60,6 +95,8 @@ class ConfigFormatHandler(ABC):
 class ClaudeDesktopHandler(ConfigFormatHandler):
     """Handler for Claude Desktop's mcpServers configuration format."""
     
+    __slots__ = ()
+    
     def detect_format(self, config_data: dict) -> bool:
         return 'mcpServers' in config_data
     
@@ -96,6 +133,8 @@ class ClaudeDesktopHandler(ConfigFormatHandler):
 class StandardMCPHandler(ConfigFormatHandler):
     """Handler for the standard MCP configuration format used by other apps."""
     
+    __slots__ = ()
+    
     def detect_format(self, config_data: dict) -> bool:
         return 'mcp' in config_data
     
@@ -115,6 +154,8 @@ class StandardMCPHandler(ConfigFormatHandler):
 class VSCodeHandler(ConfigFormatHandler):
     """Handler for VSCode's settings.json mcp.servers configuration format."""
     
+    __slots__ = ()
+    
     def detect_format(self, config_data: dict) -> bool:
         return 'mcp' in config_data and isinstance(config_data['mcp'], dict) and 'servers' in config_data['mcp']
     
@@ -135,28 +176,32 @@ class VSCodeHandler(ConfigFormatHandler):
     def merge_mcp_config(self, existing_config: dict, mcp_config: dict) -> dict:
         """Merge MCP config back into VSCode settings format."""
         updated_config = existing_config.copy()
-        
-        # Initialize mcp section if it doesn't exist
-        if 'mcp' not in updated_config:
-            updated_config['mcp'] = {}
-        
+
+        # Work on a copy of the nested mcp section: writing into the
+        # original would mutate the caller's dict, which both corrupts the
+        # parse cache and makes the changed-content check compare the
+        # merged config against itself
+        existing_mcp = existing_config.get('mcp')
+        mcp_section = dict(existing_mcp) if isinstance(existing_mcp, dict) else {}
+
         # Handle different input formats
         if isinstance(mcp_config, dict) and 'servers' in mcp_config:
             # Normalized format from VSCode or Claude Desktop
-            updated_config['mcp']['servers'] = mcp_config['servers']
+            mcp_section['servers'] = mcp_config['servers']
             if 'inputs' in mcp_config:
-                updated_config['mcp']['inputs'] = mcp_config['inputs']
+                mcp_section['inputs'] = mcp_config['inputs']
         elif isinstance(mcp_config, dict) and 'mcpServers' in mcp_config:
             # Claude Desktop format
-            updated_config['mcp']['servers'] = mcp_config['mcpServers']
+            mcp_section['servers'] = mcp_config['mcpServers']
         else:
             # Legacy format - wrap servers in VSCode structure
-            updated_config['mcp']['servers'] = mcp_config
-            
+            mcp_section['servers'] = mcp_config
+
         # Ensure inputs exists
-        if 'inputs' not in updated_config['mcp']:
-            updated_config['mcp']['inputs'] = []
-        
+        if 'inputs' not in mcp_section:
+            mcp_section['inputs'] = []
+
+        updated_config['mcp'] = mcp_section
         return updated_config
     
     def get_format_name(self) -> str:
@@ -165,6 +210,8 @@ class VSCodeHandler(ConfigFormatHandler):
 class CursorHandler(ConfigFormatHandler):
     """Handler for Cursor's mixed mcpServers + mcp.servers configuration format."""
     
+    __slots__ = ()
+    
     def detect_format(self, config_data: dict) -> bool:
         """Detect Cursor's specific mixed format with both mcpServers and mcp sections."""
         return ('mcpServers' in config_data and 
@@ -204,6 +251,8 @@ class CursorHandler(ConfigFormatHandler):
 class LegacyMCPHandler(ConfigFormatHandler):
     """Handler for legacy/empty configurations that need to be initialized."""
     
+    __slots__ = ()
+    
     def detect_format(self, config_data: dict) -> bool:
         # This handler accepts any config that doesn't match other formats
         return True
@@ -221,6 +270,14 @@ class LegacyMCPHandler(ConfigFormatHandler):
     def get_format_name(self) -> str:
         return "Legacy/Empty"
 
+# Handlers are stateless, so one instance of each is shared everywhere
+# instead of constructing fresh ones per registry entry
+_CLAUDE_HANDLER = ClaudeDesktopHandler()
+_VSCODE_HANDLER = VSCodeHandler()
+_CURSOR_HANDLER = CursorHandler()
+_STANDARD_HANDLER = StandardMCPHandler()
+_LEGACY_HANDLER = LegacyMCPHandler()
+
 class MCPConfigWatcher(FileSystemEventHandler):
     """File system event handler for watching MCP configuration changes."""
     
@@ -228,8 +285,25 @@ class MCPConfigWatcher(FileSystemEventHandler):
         super().__init__()
         self.synchronizer = synchronizer
         self.debounce_delay = debounce_delay
+        # Both dicts are touched only with single-key operations, which are
+        # atomic under the GIL; the worst interleaving is a redundant timer,
+        # so no lock is needed on the per-event path
         self.pending_syncs = {}
-        self.lock = threading.Lock()
+        # Monotonic timestamp of the last sync fired per app, for the
+        # leading-edge debounce decision
+        self._last_fire = {}
+        # Resolved path -> app name, built once; event matching is then a
+        # dict lookup instead of samefile() stats against every config
+        self._resolved_map = {
+            config_path.resolve(): app_name
+            for app_name, config_path in synchronizer.CONFIG_FILES.items()
+        }
+        # Fast path keyed by the unresolved configured path: most events
+        # carry it verbatim, making the match zero syscalls
+        self._path_map = {
+            config_path: app_name
+            for app_name, config_path in synchronizer.CONFIG_FILES.items()
+        }
         
     def on_modified(self, event):
         if event.is_directory:
@@ -237,65 +311,78 @@ class MCPConfigWatcher(FileSystemEventHandler):
             
         file_path = Path(event.src_path)
         
-        # Check if this is one of our monitored config files
-        source_app = None
-        for app_name, config_path in self.synchronizer.CONFIG_FILES.items():
+        # Check if this is one of our monitored config files; try the
+        # verbatim path first and only resolve symlinks on a miss
+        source_app = self._path_map.get(file_path)
+        if source_app is None:
             try:
-                if file_path.exists() and config_path.exists() and file_path.samefile(config_path):
-                    source_app = app_name
-                    break
-            except (OSError, FileNotFoundError):
+                source_app = self._resolved_map.get(file_path.resolve())
+            except OSError:
                 # File might have been deleted or moved, skip
-                continue
+                return
         
         if source_app:
             # Check if this change was caused by our own sync operation
             if self._is_sync_in_progress(source_app):
-                logger.debug(f"Ignoring self-triggered change in {source_app} config")
+                logger.debug("Ignoring self-triggered change in %s config", source_app)
                 return
                 
-            logger.info(f"Detected external change in {source_app} config: {file_path}")
+            logger.info("Detected external change in %s config: %s", source_app, file_path)
             self._schedule_sync(source_app, file_path)
     
     def _is_sync_in_progress(self, app_name):
         """Check if a sync operation is currently in progress for this app."""
         # Simple check - if there's a pending sync, assume we might be in the middle of it
-        with self.lock:
-            return app_name in self.pending_syncs
+        return app_name in self.pending_syncs
     
     def _schedule_sync(self, source_app, file_path):
-        """Schedule a sync with debouncing to avoid rapid successive syncs."""
-        with self.lock:
-            # Cancel any existing timer for this app
-            if source_app in self.pending_syncs:
-                self.pending_syncs[source_app].cancel()
-            
-            # Schedule new sync
-            timer = threading.Timer(
-                self.debounce_delay, 
-                self._execute_sync, 
-                args=(source_app, file_path)
-            )
-            timer.start()
-            self.pending_syncs[source_app] = timer
+        """Schedule a sync: isolated edits fire immediately, bursts coalesce.
+
+        Leading-edge debounce — the first change after a quiet period syncs
+        right away instead of always waiting out the full delay; changes
+        arriving inside the window are batched behind one trailing timer.
+        """
+        now = time.monotonic()
+        if source_app in self.pending_syncs:
+            # A timer is already armed for this burst; it will pick up
+            # the latest file state when it fires
+            return
+        
+        if now - self._last_fire.get(source_app, 0.0) > self.debounce_delay:
+            # Quiet period over: fire now (on a timer thread so the
+            # watchdog event thread is never blocked by a sync)
+            delay = 0.0
+        else:
+            delay = self.debounce_delay
+        
+        timer = threading.Timer(
+            delay, 
+            self._execute_sync, 
+            args=(source_app, file_path)
+        )
+        # Register before starting: an immediate timer can run (and pop the
+        # entry) before a post-start assignment would land, leaving a stale
+        # entry that blocks all future syncs for the app
+        self.pending_syncs[source_app] = timer
+        timer.start()
     
     def _execute_sync(self, source_app, file_path):
         """Execute the actual sync operation."""
         try:
-            logger.info(f"Starting automatic sync from {source_app}")
+            logger.info("Starting automatic sync from %s", source_app)
             success = self.synchronizer.sync_from_file(source_app)
             
             if success:
-                logger.info(f"Automatic sync from {source_app} completed successfully")
+                logger.info("Automatic sync from %s completed successfully", source_app)
             else:
-                logger.error(f"Automatic sync from {source_app} failed")
+                logger.error("Automatic sync from %s failed", source_app)
                 
         except Exception as e:
-            logger.error(f"Error during automatic sync from {source_app}: {e}")
+            logger.error("Error during automatic sync from %s: %s", source_app, e)
         finally:
-            # Clean up the timer reference
-            with self.lock:
-                self.pending_syncs.pop(source_app, None)
+            # Clean up the timer reference and start the quiet period
+            self.pending_syncs.pop(source_app, None)
+            self._last_fire[source_app] = time.monotonic()
 
 class MCPSyncDaemon:
     """Daemon for running continuous MCP configuration synchronization."""
@@ -303,16 +390,30 @@ class MCPSyncDaemon:
     def __init__(self, synchronizer, watch_apps=None, debounce_delay=2.0):
         self.synchronizer = synchronizer
         self.watch_apps = watch_apps or list(synchronizer.CONFIG_FILES.keys())
+        # Flag unknown names up front instead of silently skipping them in
+        # start(); membership is a dict-key lookup per name
+        invalid_apps = [app for app in self.watch_apps
+                        if app not in synchronizer.CONFIG_FILES]
+        if invalid_apps:
+            logger.warning("Ignoring unknown watch apps: %s (valid: %s)",
+                           ', '.join(invalid_apps),
+                           ', '.join(synchronizer.CONFIG_FILES))
+            self.watch_apps = [app for app in self.watch_apps
+                               if app in synchronizer.CONFIG_FILES]
         self.debounce_delay = debounce_delay
+        # Deferred import: selecting the platform observer backend is the
+        # expensive part of watchdog, and only daemon runs need it
+        from watchdog.observers import Observer
         self.observer = Observer()
         self.event_handler = MCPConfigWatcher(synchronizer, debounce_delay)
         self.running = False
+        self._stop_event = threading.Event()
         
     def start(self):
         """Start the file watching daemon."""
         logger.info("Starting MCP Config Sync Daemon")
-        logger.info(f"Watching apps: {', '.join(self.watch_apps)}")
-        logger.info(f"Debounce delay: {self.debounce_delay}s")
+        logger.info("Watching apps: %s", ', '.join(self.watch_apps))
+        logger.info("Debounce delay: %ss", self.debounce_delay)
         
         # Setup file watchers for each monitored app
         watched_paths = set()
@@ -329,7 +430,7 @@ class MCPSyncDaemon:
                         recursive=False
                     )
                     watched_paths.add(watch_dir)
-                    logger.info(f"Watching directory: {watch_dir}")
+                    logger.info("Watching directory: %s", watch_dir)
         
         # Start the observer
         self.observer.start()
@@ -342,8 +443,10 @@ class MCPSyncDaemon:
         logger.info("Daemon started. Press Ctrl+C to stop.")
         
         try:
-            while self.running:
-                time.sleep(1)
+            # Block until a shutdown signal sets the event; no wakeups while
+            # idle and shutdown is immediate instead of quantized to the
+            # polling interval
+            self._stop_event.wait()
         except KeyboardInterrupt:
             pass
         finally:
@@ -354,14 +457,16 @@ class MCPSyncDaemon:
         if self.running:
             logger.info("Stopping MCP Config Sync Daemon")
             self.running = False
+            self._stop_event.set()
             self.observer.stop()
             self.observer.join()
             logger.info("Daemon stopped")
     
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals."""
-        logger.info(f"Received signal {signum}, shutting down...")
+        logger.info("Received signal %s, shutting down...", signum)
         self.running = False
+        self._stop_event.set()
 
 class MCPConfigSynchronizer:
     """Synchronizes MCP configuration across multiple application config files."""
@@ -379,30 +484,42 @@ class MCPConfigSynchronizer:
     
     # Configuration format handlers (order matters - most specific first)
     FORMAT_HANDLERS = [
-        ClaudeDesktopHandler(),
-        VSCodeHandler(),
-        CursorHandler(),
-        StandardMCPHandler(),
-        LegacyMCPHandler()  # Fallback handler
+        _CLAUDE_HANDLER,
+        _VSCODE_HANDLER,
+        _CURSOR_HANDLER,
+        _STANDARD_HANDLER,
+        _LEGACY_HANDLER  # Fallback handler
     ]
     
     # Map applications to their preferred handlers
     APP_HANDLERS = {
-        'Claude': ClaudeDesktopHandler(),
-        'VSCode': VSCodeHandler(),
-        'Cursor': CursorHandler(),
-        'Windsurf': StandardMCPHandler(),
-        'Roocode-VSCode': StandardMCPHandler(),
-        'Roocode-Windsurf': StandardMCPHandler()
+        'Claude': _CLAUDE_HANDLER,
+        'VSCode': _VSCODE_HANDLER,
+        'Cursor': _CURSOR_HANDLER,
+        'Windsurf': _STANDARD_HANDLER,
+        'Roocode-VSCode': _STANDARD_HANDLER,
+        'Roocode-Windsurf': _STANDARD_HANDLER
     }
     
-    DEFAULT_MCP_CONFIG = {
+    # Read-only view: the shallow .copy() previously taken in __init__ left
+    # nested dicts shared across instances, so a merge on one instance could
+    # leak state into the class-level default
+    DEFAULT_MCP_CONFIG = MappingProxyType({
         'servers': {}
-    }
+    })
     
     def __init__(self):
-        self.config = self.DEFAULT_MCP_CONFIG.copy()
+        self.config = deepcopy(dict(self.DEFAULT_MCP_CONFIG))
         self.sync_results = {}
+        # Parsed configs keyed by path -> (st_mtime_ns, parsed) so repeated
+        # screens don't re-read and re-parse unchanged files
+        self._config_cache = {}
+        # Parents already created by ensure_directories; steady-state syncs
+        # skip the mkdir stat chatter entirely
+        self._ensured_dirs = set()
+        # Digest of the reference config from the last successful sync;
+        # lets sync_from_file skip touched-but-unchanged sources outright
+        self._last_sync_digest = None
         # Filter CONFIG_FILES to only include apps that are actually installed
         self._filter_installed_apps()
     
@@ -433,65 +550,131 @@ class MCPConfigSynchronizer:
             # Include the app if its directory exists (indicating it's installed)
             if app_dir and app_dir.exists():
                 installed_apps[app_name] = config_path
-                logger.debug(f"Application {app_name} detected at {app_dir}")
+                logger.debug("Application %s detected at %s", app_name, app_dir)
             else:
-                logger.debug(f"Application {app_name} not found (directory {app_dir} does not exist)")
+                logger.debug("Application %s not found (directory %s does not exist)", app_name, app_dir)
         
         # Update CONFIG_FILES with only installed applications
         self.CONFIG_FILES = installed_apps
-        logger.info(f"Detected {len(installed_apps)} installed applications: {', '.join(installed_apps.keys())}")
+        # Flat (name, path) tuple for the hot loops; iterating it avoids the
+        # dict-view machinery on every sync and validation pass
+        self._config_items = tuple(installed_apps.items())
+        logger.info("Detected %d installed applications: %s",
+                    len(installed_apps), ', '.join(installed_apps.keys()))
     
     def detect_config_format(self, config_data: dict) -> ConfigFormatHandler:
         """Detect the appropriate format handler for the given configuration."""
-        for handler in self.FORMAT_HANDLERS:
-            if handler.detect_format(config_data):
-                return handler
-        # Should never reach here due to LegacyMCPHandler fallback
-        return LegacyMCPHandler()
+        # Inlined FORMAT_HANDLERS priority order: format is fully determined
+        # by which of 'mcpServers'/'mcp' appear, so branch directly instead
+        # of polling each handler's detect_format
+        if 'mcpServers' in config_data:
+            return _CLAUDE_HANDLER
+        mcp_section = config_data.get('mcp')
+        if isinstance(mcp_section, dict) and 'servers' in mcp_section:
+            return _VSCODE_HANDLER
+        if mcp_section is not None:
+            return _STANDARD_HANDLER
+        return _LEGACY_HANDLER
     
     def get_app_handler(self, app_name: str) -> ConfigFormatHandler:
         """Get the appropriate format handler for a specific application."""
-        return self.APP_HANDLERS.get(app_name, StandardMCPHandler())
+        return self.APP_HANDLERS.get(app_name, _STANDARD_HANDLER)
     
     def ensure_directories(self):
         """Ensure all parent directories for config files exist."""
-        for config_path in self.CONFIG_FILES.values():
-            config_path.parent.mkdir(parents=True, exist_ok=True)
-            logger.info(f"Ensured directory exists: {config_path.parent}")
+        # Several configs share parent chains; deduplicate, skip parents
+        # already created on a previous pass, and create the shallower
+        # directories first so deeper mkdirs are single-level
+        parents = {config_path.parent for _, config_path in self._config_items}
+        parents -= self._ensured_dirs
+        if not parents:
+            return
+        for parent in sorted(parents, key=lambda p: len(p.parts)):
+            parent.mkdir(parents=True, exist_ok=True)
+        self._ensured_dirs |= parents
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Ensured directories exist: %s",
+                         ', '.join(str(p) for p in sorted(parents)))
     
     def load_existing_config(self, config_path):
         """Load existing configuration from a file if it exists."""
         try:
-            if config_path.exists():
-                with open(config_path, 'r') as f:
-                    return json.load(f)
-            return {}
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse config at {config_path}: {e}")
+            # Single stat instead of exists() + stat(); a missing file is
+            # the exception path, which also closes the check-then-open race
+            try:
+                st = config_path.stat()
+            except FileNotFoundError:
+                self._config_cache.pop(config_path, None)
+                return {}
+            fingerprint = (st.st_mtime_ns, st.st_size)
+            cached = self._config_cache.get(config_path)
+            if cached is not None and cached[0] == fingerprint:
+                # Hand out a copy: callers merge into and reassign these
+                # dicts, and an alias would let them poison the cached
+                # parse behind the fingerprint's back
+                return deepcopy(cached[1])
+            parsed = _loads(config_path.read_bytes())
+            self._config_cache[config_path] = (fingerprint, parsed)
+            return deepcopy(parsed)
+        except ValueError as e:
+            logger.error("Failed to parse config at %s: %s", config_path, e)
             # Return None to indicate a parsing error, not just an empty config
             return None
         except Exception as e:
-            logger.error(f"Error loading config at {config_path}: {e}")
+            logger.error("Error loading config at %s: %s", config_path, e)
             return None
     
-    def merge_configs(self, existing_config, new_config):
-        """Merge existing config with new config, preserving existing values where applicable."""
-        def deep_merge(d1, d2):
-            for key, value in d2.items():
-                if isinstance(value, dict) and key in d1:
-                    d1[key] = deep_merge(d1.get(key, {}), value)
+    def _load_all(self):
+        """Load every monitored config concurrently.
+
+        Returns {app_name: parsed_config} with the same per-file semantics
+        as load_existing_config ({} for missing, None on parse error).
+        Walltime is roughly the slowest single file instead of the sum.
+        """
+        if not self._config_items:
+            return {}
+        return dict(zip(
+            (name for name, _ in self._config_items),
+            _io_pool.map(self.load_existing_config,
+                         (path for _, path in self._config_items))
+        ))
+
+    def merge_configs(self, existing_config, new_config, copy=True):
+        """Merge existing config with new config, preserving existing values where applicable.
+
+        Uses an explicit stack instead of recursion so deeply nested configs
+        don't pay a Python frame per level. Pass copy=False when the caller
+        owns existing_config and in-place mutation is acceptable.
+        """
+        merged = deepcopy(existing_config) if copy else existing_config
+        stack = [(merged, new_config)]
+        while stack:
+            dst, src = stack.pop()
+            for key, value in src.items():
+                current = dst.get(key)
+                if current is value or current == value:
+                    # Identical subtree: nothing to merge or descend into
+                    continue
+                if isinstance(value, dict) and isinstance(current, dict):
+                    stack.append((current, value))
                 else:
-                    d1[key] = value
-            return d1
-        
-        return deep_merge(existing_config.copy(), new_config)
+                    dst[key] = value
+        return merged
+    
+    def _merge_into(self, dst, src):
+        """Deep-merge src into dst in place.
+
+        For callers that own dst and don't need the isolating copy that
+        merge_configs makes by default.
+        """
+        return self.merge_configs(dst, src, copy=False)
     
     def check_destructive_operations(self):
         """Check if the sync operation would remove existing MCP servers."""
         destructive_apps = []
         source_servers = self.config.get('servers', {})
         
-        for app_name, config_path in self.CONFIG_FILES.items():
+        for app_name, config_path in self._config_items:
             if not config_path.exists():
                 continue
                 
@@ -565,7 +748,9 @@ class MCPConfigSynchronizer:
         self.ensure_directories()
         
         if custom_config:
-            self.config = self.merge_configs(self.config, custom_config)
+            # self.config is owned by this instance; merge in place rather
+            # than deep-copying it just to reassign the result
+            self._merge_into(self.config, custom_config)
         
         # Check for destructive operations
         destructive_apps = self.check_destructive_operations()
@@ -575,58 +760,123 @@ class MCPConfigSynchronizer:
                 return {app_name: {'success': False, 'action': 'cancelled', 'reason': 'user_cancelled'} 
                        for app_name in self.CONFIG_FILES.keys()}
         
+        # Phase 1: prepare every app concurrently — load, merge, and stage
+        # the serialized payload in a .tmp sibling. No live config has been
+        # touched when this phase finishes.
+        futures = {
+            app_name: _io_pool.submit(self._prepare_one, app_name, config_path)
+            for app_name, config_path in self._config_items
+        }
+        prepared = {app_name: future.result() for app_name, future in futures.items()}
+        
+        # Phase 2: commit the staged files with a tight rename loop, so the
+        # window in which apps can disagree is a handful of os.replace
+        # calls rather than interleaved read/merge/write cycles
         results = {}
-        for app_name, config_path in self.CONFIG_FILES.items():
+        for app_name, config_path in self._config_items:
+            result, commit = prepared[app_name]
+            if commit is None:
+                results[app_name] = result
+                continue
+            tmp_path, updated_config, size, action, format_name = commit
             try:
-                # Load existing config to preserve any app-specific settings
-                existing_config = self.load_existing_config(config_path)
-                
-                # If parsing failed, skip this config
-                if existing_config is None:
-                    logger.error(f"Skipping update for {app_name} due to parsing error")
-                    results[app_name] = {
-                        'success': False, 
-                        'path': config_path,
-                        'error': 'Failed to parse existing config',
-                        'action': 'skipped'
-                    }
-                    continue
-                
-                # Get file status before update
-                file_existed = config_path.exists()
-                
-                # Get the appropriate handler for this app
-                handler = self.get_app_handler(app_name)
-                
-                # Merge with new MCP config using format-specific handler
-                updated_config = handler.merge_mcp_config(existing_config, self.config)
-                
-                # Write updated config
-                with open(config_path, 'w') as f:
-                    json.dump(updated_config, f, indent=2)
-                
-                # Record result
-                action = 'updated' if file_existed else 'created'
-                logger.info(f"Successfully {action} config for {app_name} at {config_path} using {handler.get_format_name()} format")
+                os.replace(tmp_path, config_path)
+                # Warm the parse cache with what was just written, so the
+                # validation pass right after a sync parses nothing
+                st = config_path.stat()
+                # Deep-copy before caching: updated_config still shares
+                # nested dicts with self.config, which later merges mutate
+                self._config_cache[config_path] = (
+                    (st.st_mtime_ns, st.st_size), deepcopy(updated_config))
+                logger.info("Successfully %s config for %s at %s using %s format", action, app_name, config_path, format_name)
                 results[app_name] = {
                     'success': True, 
                     'path': config_path,
                     'action': action,
-                    'size': config_path.stat().st_size,
-                    'format': handler.get_format_name()
+                    'size': size,
+                    'format': format_name
                 }
-                
             except Exception as e:
-                logger.error(f"Failed to update config for {app_name} at {config_path}: {e}")
+                logger.error("Failed to update config for %s at %s: %s", app_name, config_path, e)
                 results[app_name] = {
                     'success': False, 
                     'path': config_path,
                     'error': str(e),
                     'action': 'failed'
                 }
-        
         return results
     
+    def _prepare_one(self, app_name, config_path):
+        """Load, merge, and stage one application's config update.
+
+        Returns (result, commit): result is the finished per-app result
+        dict when there is nothing to rename (skipped, unchanged, failed);
+        commit carries the staged temp file and its metadata for the
+        rename phase otherwise.
+        """
+        try:
+            # Load existing config to preserve any app-specific settings
+            existing_config = self.load_existing_config(config_path)
+            
+            # If parsing failed, skip this config
+            if existing_config is None:
+                logger.error("Skipping update for %s due to parsing error", app_name)
+                return ({
+                    'success': False, 
+                    'path': config_path,
+                    'error': 'Failed to parse existing config',
+                    'action': 'skipped'
+                }, None)
+            
+            # Get file status before update
+            file_existed = config_path.exists()
+            
+            # Get the appropriate handler for this app
+            handler = self.get_app_handler(app_name)
+            
+            # Merge with new MCP config using format-specific handler
+            updated_config = handler.merge_mcp_config(existing_config, self.config)
+            
+            # Idempotent runs skip the write entirely when the merge
+            # changed nothing
+            if file_existed and updated_config == existing_config:
+                logger.info("Config for %s already up to date at %s", app_name, config_path)
+                return ({
+                    'success': True,
+                    'path': config_path,
+                    'action': 'unchanged',
+                    'size': config_path.stat().st_size,
+                    'format': handler.get_format_name()
+                }, None)
+            
+            # Serialize once and stage atomically next to the target; the
+            # rename happens in the commit phase. The pid suffix keeps
+            # concurrent processes from clobbering each other's staging
+            # file, and the fsync makes the rename durable: a crash right
+            # after os.replace must not leave a truncated config behind
+            encoded = _dumps(updated_config)
+            tmp_path = config_path.with_suffix(
+                config_path.suffix + f'.tmp.{os.getpid()}')
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, encoded)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            
+            action = 'updated' if file_existed else 'created'
+            return (None, (tmp_path, updated_config, len(encoded), action,
+                           handler.get_format_name()))
+            
+        except Exception as e:
+            logger.error("Failed to update config for %s at %s: %s", app_name, config_path, e)
+            return ({
+                'success': False, 
+                'path': config_path,
+                'error': str(e),
+                'action': 'failed'
+            }, None)
+    
     def validate_configs(self, reference_config=None):
         """Validate that all configuration files are in sync and properly formatted."""
         if reference_config is None:
@@ -635,16 +885,50 @@ class MCPConfigSynchronizer:
         all_in_sync = True
         validation_results = {}
         
-        for app_name, config_path in self.CONFIG_FILES.items():
+        # Fan the file loads out before the serial comparison pass
+        configs = self._load_all()
+        
+        # Digest of the reference, computed once: equal digests mean equal
+        # configs, so the in-sync case is a 128-bit compare per app instead
+        # of a recursive dict walk
+        try:
+            reference_digest = hashlib.blake2b(
+                _canonical_dumps(reference_config), digest_size=16).digest()
+        except TypeError:
+            reference_digest = None
+        
+        # Flatten the reference to (path, leaf) pairs once per run; every
+        # app is then checked against the same flat view instead of
+        # re-walking the reference tree. Empty dict subtrees get a
+        # sentinel leaf so a missing subtree (e.g. no 'servers' key at
+        # all) is still flagged rather than vacuously matching
+        empty_subtree = object()
+        flat_reference = []
+        flatten_stack = [((), reference_config)]
+        while flatten_stack:
+            prefix, node = flatten_stack.pop()
+            for key, value in node.items():
+                # Skip format field as it's metadata, not actual config data
+                if key == 'format':
+                    continue
+                if isinstance(value, dict):
+                    if value:
+                        flatten_stack.append((prefix + (key,), value))
+                    else:
+                        flat_reference.append((prefix + (key,), empty_subtree))
+                else:
+                    flat_reference.append((prefix + (key,), value))
+        
+        for app_name, config_path in self._config_items:
             if not config_path.exists():
-                logger.warning(f"Config file missing for {app_name} at {config_path}")
+                logger.warning("Config file missing for %s at %s", app_name, config_path)
                 validation_results[app_name] = {'in_sync': False, 'reason': 'missing'}
                 all_in_sync = False
                 continue
                 
-            config = self.load_existing_config(config_path)
+            config = configs[app_name]
             if config is None:
-                logger.warning(f"Config file for {app_name} at {config_path} could not be parsed")
+                logger.warning("Config file for %s at %s could not be parsed", app_name, config_path)
                 validation_results[app_name] = {'in_sync': False, 'reason': 'parse_error'}
                 all_in_sync = False
                 continue
@@ -653,6 +937,22 @@ class MCPConfigSynchronizer:
             handler = self.detect_config_format(config)
             mcp_config = handler.extract_mcp_config(config)
             
+            # Identical serialized content short-circuits the deep compare;
+            # differing digests still fall through to the full walk, which
+            # tolerates metadata like the format field
+            if reference_digest is not None:
+                try:
+                    app_digest = hashlib.blake2b(
+                        _canonical_dumps(mcp_config), digest_size=16).digest()
+                except TypeError:
+                    app_digest = None
+                if app_digest == reference_digest:
+                    validation_results[app_name] = {
+                        'in_sync': True,
+                        'format': handler.get_format_name()
+                    }
+                    continue
+            
             # For Claude Desktop format, we need to compare the servers structure
             if isinstance(handler, ClaudeDesktopHandler):
                 # Extract servers from both configurations for comparison
@@ -661,7 +961,7 @@ class MCPConfigSynchronizer:
                 
                 # If reference config is in legacy format, we can't do meaningful comparison
                 if not ref_servers and reference_config:
-                    logger.info(f"Skipping validation for {app_name} - reference config is in legacy format, app uses Claude Desktop format")
+                    logger.info("Skipping validation for %s - reference config is in legacy format, app uses Claude Desktop format", app_name)
                     validation_results[app_name] = {'in_sync': True, 'reason': 'format_mismatch_skip'}
                     continue
                 
@@ -672,36 +972,36 @@ class MCPConfigSynchronizer:
                 else:
                     mismatched_keys = []
             else:
-                # Standard validation for other formats
+                # Standard validation for other formats: C-level dict
+                # equality settles identical trees in one call; only configs
+                # that differ (often just format metadata) take the flat pass
                 is_in_sync = True
                 mismatched_keys = []
                 
-                def check_nested_dict(ref_dict, app_dict, path=""):
-                    nonlocal is_in_sync, mismatched_keys
-                    for key, ref_value in ref_dict.items():
-                        # Skip format field as it's metadata, not actual config data
-                        if key == 'format':
-                            continue
-                            
-                        if key not in app_dict:
-                            is_in_sync = False
-                            mismatched_keys.append(f"{path}{key} (missing)")
-                            continue
-                            
-                        app_value = app_dict[key]
-                        if isinstance(ref_value, dict) and isinstance(app_value, dict):
-                            check_nested_dict(ref_value, app_value, f"{path}{key}.")
-                        elif ref_value != app_value:
+                flat_items = () if mcp_config == reference_config else flat_reference
+                for path, ref_value in flat_items:
+                    node = mcp_config
+                    for part in path[:-1]:
+                        node = node.get(part)
+                        if not isinstance(node, dict):
+                            break
+                    leaf = path[-1]
+                    if not isinstance(node, dict) or leaf not in node:
+                        is_in_sync = False
+                        mismatched_keys.append(f"{'.'.join(path)} (missing)")
+                    elif ref_value is empty_subtree:
+                        if not isinstance(node[leaf], dict):
                             is_in_sync = False
-                            mismatched_keys.append(f"{path}{key} (value mismatch)")
-                
-                check_nested_dict(reference_config, mcp_config)
+                            mismatched_keys.append(f"{'.'.join(path)} (value mismatch)")
+                    elif node[leaf] != ref_value:
+                        is_in_sync = False
+                        mismatched_keys.append(f"{'.'.join(path)} (value mismatch)")
             
             if not is_in_sync:
-                logger.warning(f"Config mismatch detected for {app_name} at {config_path}")
-                logger.warning(f"Mismatched keys: {', '.join(mismatched_keys)}")
-                logger.debug(f"Reference config for {app_name}: {reference_config}")
-                logger.debug(f"App config for {app_name}: {mcp_config}")
+                logger.warning("Config mismatch detected for %s at %s", app_name, config_path)
+                logger.warning("Mismatched keys: %s", ', '.join(mismatched_keys))
+                logger.debug("Reference config for %s: %s", app_name, reference_config)
+                logger.debug("App config for %s: %s", app_name, mcp_config)
                 validation_results[app_name] = {
                     'in_sync': False, 
                     'reason': 'mismatch',
@@ -720,13 +1020,47 @@ class MCPConfigSynchronizer:
         
         return all_in_sync, validation_results
     
+    def is_all_in_sync(self, reference_config=None):
+        """Fast boolean check that every config matches the reference.
+
+        Compares content digests and returns as soon as the answer is
+        known, without building the per-app breakdown. Anything ambiguous
+        (missing files, digest mismatches that may only be format
+        metadata) defers to validate_configs for the authoritative
+        answer, so a True here is always trustworthy.
+        """
+        if reference_config is None:
+            reference_config = self.config
+        
+        try:
+            reference_digest = hashlib.blake2b(
+                _canonical_dumps(reference_config), digest_size=16).digest()
+        except TypeError:
+            return self.validate_configs(reference_config)[0]
+        
+        configs = self._load_all()
+        for app_name, _ in self._config_items:
+            config = configs[app_name]
+            if not config:
+                return self.validate_configs(reference_config)[0]
+            handler = self.detect_config_format(config)
+            try:
+                app_digest = hashlib.blake2b(
+                    _canonical_dumps(handler.extract_mcp_config(config)),
+                    digest_size=16).digest()
+            except TypeError:
+                return self.validate_configs(reference_config)[0]
+            if app_digest != reference_digest:
+                return self.validate_configs(reference_config)[0]
+        return True
+    
     def print_report(self, sync_results, validation_results, source=None):
         """Print a detailed report of the synchronization operation."""
         # Determine overall status
         all_success = all(result.get('success', False) for result in sync_results.values())
         all_in_sync = all(result.get('in_sync', False) for result in validation_results.values())
         
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
         overall_status = "SUCCESS" if all_success and all_in_sync else "PARTIAL_SUCCESS" if all_success else "FAILED"
         
         # Count successful configurations
@@ -756,8 +1090,7 @@ class MCPConfigSynchronizer:
         header_text += f"""
 📊 Apps Configured: [bold]{success_count}/{total_count}[/bold]"""
         
-        console.print()
-        console.print(Panel(header_text, title="🔄 Sync Report", border_style=status_color, padding=(1, 2)))
+        header_panel = Panel(header_text, title="🔄 Sync Report", border_style=status_color, padding=(1, 2))
         
         # Create details table
         table = Table(
@@ -773,9 +1106,13 @@ class MCPConfigSynchronizer:
         table.add_column("Validation", justify="center", width=12)
         table.add_column("Details", style="dim", width=30)
         
-        # Populate table with app details
+        # Populate table with app details; bind each result's fields to
+        # locals once instead of repeated .get() calls per column
         for app_name, result in sync_results.items():
             success = result.get('success', False)
+            path = result.get('path')
+            size = result.get('size')
+            error = result.get('error', '')
             
             # Status icon and color
             if success:
@@ -786,25 +1123,27 @@ class MCPConfigSynchronizer:
                 status_color = "red"
             
             # Action and size
-            action = result.get('action', 'failed') if success else result.get('action', 'failed')
-            size_str = f"{result.get('size', 0)} B" if success and 'size' in result else "—"
+            action = result.get('action', 'failed')
+            size_str = f"{size} B" if success and size is not None else "—"
             
             # Details column (initialize first)
             details = ""
-            if success and 'path' in result:
-                path_parts = str(result['path']).split('/')
+            if success and path is not None:
+                path_parts = str(path).split('/')
                 if len(path_parts) > 3:
                     details = f".../{'/'.join(path_parts[-2:])}"
                 else:
-                    details = str(result['path'])
+                    details = str(path)
             elif not success:
                 if action == 'cancelled':
                     details = result.get('reason', 'user cancelled')
+                elif error:
+                    details = error[:30] + "..." if len(error) > 30 else error
                 else:
-                    details = result.get('error', 'Unknown error')[:30] + "..." if len(result.get('error', '')) > 30 else result.get('error', 'Unknown error')
+                    details = 'Unknown error'
             
             # Validation status
-            validation = validation_results.get(app_name, {})
+            validation = validation_results.get(app_name) or _EMPTY
             if validation and success:
                 in_sync = validation.get('in_sync', False)
                 if in_sync:
@@ -830,8 +1169,9 @@ class MCPConfigSynchronizer:
                 details
             )
         
-        console.print(table)
-        console.print()
+        # Emit the whole report in one console write instead of separate
+        # flushes for the spacing, panel, and table
+        console.print(Group(Text(""), header_panel, table, Text("")))
         return overall_status
     
     def sync_from_file(self, app_name_or_path, force=False):
@@ -849,13 +1189,13 @@ class MCPConfigSynchronizer:
             source_name = str(source_path)
         
         if not source_path.exists():
-            logger.error(f"Source file does not exist: {source_path}")
+            logger.error("Source file does not exist: %s", source_path)
             return False
         
         # Load configuration from source
         source_config = self.load_existing_config(source_path)
         if source_config is None:
-            logger.error(f"Failed to parse source configuration at {source_path}")
+            logger.error("Failed to parse source configuration at %s", source_path)
             return False
         
         # Detect format and extract MCP configuration using appropriate handler
@@ -863,14 +1203,29 @@ class MCPConfigSynchronizer:
         mcp_config = handler.extract_mcp_config(source_config)
         
         if not mcp_config:
-            logger.error(f"No MCP configuration found in {source_path}")
+            logger.error("No MCP configuration found in %s", source_path)
             return False
         
-        logger.info(f"Loaded reference MCP configuration from {source_name} using {handler.get_format_name()} format")
+        logger.info("Loaded reference MCP configuration from %s using %s format",
+                    source_name, handler.get_format_name())
         
         # Update config with the loaded MCP configuration
         self.config = mcp_config
         
+        # Editors fire events for saves that change nothing; when the
+        # extracted config digests the same as the last successful sync and
+        # every target still matches it, there is no work to do
+        try:
+            source_digest = hashlib.blake2b(
+                _canonical_dumps(mcp_config), digest_size=16).digest()
+        except TypeError:
+            source_digest = None
+        if (source_digest is not None
+                and source_digest == self._last_sync_digest
+                and self.is_all_in_sync(mcp_config)):
+            logger.info("Source %s unchanged since last sync, skipping", source_name)
+            return True
+        
         # Apply to all configs
         sync_results = self.update_configs(force=force)
         
@@ -881,9 +1236,10 @@ class MCPConfigSynchronizer:
         status = self.print_report(sync_results, validation_results, source=source_name)
         
         if status == "SUCCESS":
-            logger.info(f"MCP configuration synchronization from source completed successfully")
+            self._last_sync_digest = source_digest
+            logger.info("MCP configuration synchronization from source completed successfully")
             return True
         else:
-            logger.error(f"MCP configuration synchronization from source completed with issues")
+            logger.error("MCP configuration synchronization from source completed with issues")
             return False
 
@@ -6,11 +6,13 @@ This application provides an interactive terminal interface for managing
 MCP servers across multiple applications with real-time synchronization.
 """
 
-import json
 import asyncio
+import itertools
+import os
+from functools import partial
 from pathlib import Path
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from textual.app import App, ComposeResult
 from textual.containers import Container, Vertical, Horizontal, ScrollableContainer
@@ -19,7 +21,10 @@ from textual.widgets import (
     TextArea, Label, Tree, Collapsible, Switch, Checkbox, ProgressBar,
     ListView, ListItem, OptionList
 )
+from textual.widgets.option_list import Option
 from textual.screen import Screen, ModalScreen
+from textual import work
+from textual.worker import WorkerCancelled
 from textual.binding import Binding
 from textual.reactive import reactive
 from textual.message import Message
@@ -28,10 +33,10 @@ from textual.coordinate import Coordinate
 
 from rich.text import Text
 
-from mcp_core import MCPConfigSynchronizer
+from mcp_core import MCPConfigSynchronizer, _dumps, _loads
 
 
-@dataclass
+@dataclass(slots=True)
 class MCPServer:
     """Data class representing an MCP server configuration."""
     name: str
@@ -39,14 +44,21 @@ class MCPServer:
     args: List[str]
     env: Dict[str, str]
     enabled: bool = True
+    _cached_dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary format for JSON serialization."""
-        return {
-            "command": self.command,
-            "args": self.args,
-            "env": self.env if self.env else None
-        }
+        # Edits replace the whole instance, so the serialized form can be
+        # built once and reused by every sync/save that follows
+        cached = self._cached_dict
+        if cached is None:
+            cached = self._cached_dict = {
+                "command": self.command,
+                "args": self.args,
+                "env": self.env if self.env else None
+            }
+        return cached
 
     @classmethod
     def from_dict(cls, name: str, data: Dict[str, Any]) -> 'MCPServer':
@@ -99,6 +111,10 @@ class ServerFormScreen(ModalScreen):
         self.server = server
         self.is_edit = is_edit
         self.result: Optional[MCPServer] = None
+        # The text the env field is populated with; saves that leave it
+        # untouched can reuse the original dict without reparsing
+        self._original_env_text = (
+            _dumps(server.env).decode() if server and server.env else "{}")
     
     def compose(self) -> ComposeResult:
         title = "Edit MCP Server" if self.is_edit else "Add MCP Server"
@@ -131,7 +147,7 @@ class ServerFormScreen(ModalScreen):
             
             yield Label("Environment Variables (JSON format):", classes="form-field")
             yield TextArea(
-                text=json.dumps(self.server.env, indent=2) if self.server and self.server.env else "{}",
+                text=self._original_env_text,
                 id="env_input",
                 classes="form-field"
             )
@@ -141,8 +157,12 @@ class ServerFormScreen(ModalScreen):
                 yield Button("Cancel (Esc)", id="cancel_btn")
     
     def on_mount(self) -> None:
-        """Set initial focus when screen mounts."""
-        self.query_one("#name_input").focus()
+        """Cache widget references and set initial focus."""
+        self._name_input = self.query_one("#name_input", Input)
+        self._command_input = self.query_one("#command_input", Input)
+        self._args_input = self.query_one("#args_input", TextArea)
+        self._env_input = self.query_one("#env_input", TextArea)
+        self._name_input.focus()
     
     def action_save(self) -> None:
         """Save action triggered by Ctrl+S."""
@@ -161,24 +181,32 @@ class ServerFormScreen(ModalScreen):
     def _save_server(self) -> None:
         """Validate and save the server configuration."""
         try:
-            name = self.query_one("#name_input", Input).value.strip()
-            command = self.query_one("#command_input", Input).value.strip()
-            args_text = self.query_one("#args_input", TextArea).text.strip()
-            env_text = self.query_one("#env_input", TextArea).text.strip()
+            name = self._name_input.value.strip()
+            command = self._command_input.value.strip()
+            args_text = self._args_input.text.strip()
+            env_text = self._env_input.text.strip()
             
             if not name or not command:
                 self.notify("Name and command are required", severity="error")
                 return
             
-            args = [arg.strip() for arg in args_text.split('\n') if arg.strip()]
+            # splitlines handles CRLF pastes and the walrus keeps it to
+            # one strip per line
+            args = [stripped for line in args_text.splitlines()
+                    if (stripped := line.strip())]
             
-            try:
-                env = json.loads(env_text) if env_text else {}
-                if not isinstance(env, dict):
-                    raise ValueError("Environment must be a JSON object")
-            except json.JSONDecodeError as e:
-                self.notify(f"Invalid JSON in environment variables: {e}", severity="error")
-                return
+            if env_text == self._original_env_text.strip():
+                # Only name/command/args changed; no need to reparse
+                env = self.server.env if self.server else {}
+            else:
+                try:
+                    env = _loads(env_text) if env_text else {}
+                    if not isinstance(env, dict):
+                        self.notify("Environment must be a JSON object", severity="error")
+                        return
+                except ValueError as e:
+                    self.notify(f"Invalid JSON in environment variables: {e}", severity="error")
+                    return
             
             server = MCPServer(
                 name=name,
@@ -250,18 +278,18 @@ class SyncScreen(ModalScreen):
             
             yield Label("📦 Select servers to sync (SPACE to toggle):", classes="sync-options")
             
-            server_options = [(name, name, name in self.selected_servers) for name in self.available_servers.keys()]
             yield OptionList(
-                *server_options,
+                *(Option(self._prompt(name, name in self.selected_servers), id=name)
+                  for name in self.available_servers),
                 id="server_list",
                 classes="option-list"
             )
             
             yield Label("📱 Select target applications (SPACE to toggle):", classes="sync-options")
             
-            app_options = [(name, name, name in self.selected_apps) for name in self.synchronizer.CONFIG_FILES.keys()]
             yield OptionList(
-                *app_options,
+                *(Option(self._prompt(name, name in self.selected_apps), id=name)
+                  for name in self.synchronizer.CONFIG_FILES),
                 id="app_list",
                 classes="option-list"
             )
@@ -274,29 +302,28 @@ class SyncScreen(ModalScreen):
         """Set initial focus when screen mounts."""
         self.query_one("#server_list").focus()
     
+    @staticmethod
+    def _prompt(name: str, selected: bool) -> str:
+        """Render the checkbox-style prompt for one option."""
+        return f"[{'x' if selected else ' '}] {name}"
+    
     def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
         """Handle option selection/deselection."""
-        option_list = event.option_list
-        option_id = event.option.id
-        
+        self._toggle_option(event.option_list, event.option_index)
+    
+    def _toggle_option(self, option_list: OptionList, index: int) -> None:
+        """Toggle one option's membership and redraw just its prompt."""
+        option_id = option_list.get_option_at_index(index).id
         if option_list.id == "server_list":
-            if option_id in self.selected_servers:
-                self.selected_servers.discard(option_id)
-                option_list.remove_option_at(event.option_index)
-                option_list.add_option((option_id, option_id, False), event.option_index)
-            else:
-                self.selected_servers.add(option_id)
-                option_list.remove_option_at(event.option_index)
-                option_list.add_option((option_id, option_id, True), event.option_index)
+            selected = self.selected_servers
         elif option_list.id == "app_list":
-            if option_id in self.selected_apps:
-                self.selected_apps.discard(option_id)
-                option_list.remove_option_at(event.option_index)
-                option_list.add_option((option_id, option_id, False), event.option_index)
-            else:
-                self.selected_apps.add(option_id)
-                option_list.remove_option_at(event.option_index)
-                option_list.add_option((option_id, option_id, True), event.option_index)
+            selected = self.selected_apps
+        else:
+            return
+        
+        selected ^= {option_id}
+        option_list.replace_option_prompt_at_index(
+            index, self._prompt(option_id, option_id in selected))
     
     def action_sync(self) -> None:
         """Perform sync action."""
@@ -309,13 +336,8 @@ class SyncScreen(ModalScreen):
     def action_toggle_selection(self) -> None:
         """Toggle selection of current option."""
         focused = self.focused
-        if isinstance(focused, OptionList):
-            if focused.highlighted is not None:
-                # Simulate selection
-                option = focused.get_option_at_index(focused.highlighted)
-                if option:
-                    event = OptionList.OptionSelected(focused, option, focused.highlighted)
-                    self.on_option_list_option_selected(event)
+        if isinstance(focused, OptionList) and focused.highlighted is not None:
+            self._toggle_option(focused, focused.highlighted)
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "sync_btn":
@@ -341,16 +363,19 @@ class SyncScreen(ModalScreen):
             }
         }
         
-        # Update synchronizer config
+        # The writes run off-thread so the dialog stays responsive
+        self._sync_worker(sync_config, len(self.selected_apps))
+    
+    @work(thread=True, exclusive=True, group="sync")
+    def _sync_worker(self, sync_config: Dict, total_count: int) -> None:
+        """Run the synchronization off the UI thread."""
         self.synchronizer.config = sync_config
-        
-        # Perform sync
         sync_results = self.synchronizer.update_configs()
-        
-        # Show results
         success_count = sum(1 for result in sync_results.values() if result.get('success', False))
-        total_count = len(self.selected_apps)
-        
+        self.app.call_from_thread(self._finish_sync, sync_results, success_count, total_count)
+    
+    def _finish_sync(self, sync_results: Dict, success_count: int, total_count: int) -> None:
+        """Report results and close the dialog (UI thread)."""
         self.notify(f"Sync completed: {success_count}/{total_count} apps updated successfully")
         self.dismiss(sync_results)
 
@@ -435,13 +460,30 @@ class MCPManagerApp(App):
     ]
     
     current_app = reactive("Claude")
+    selected_server: reactive[Optional[str]] = reactive(None)
     
     def __init__(self):
         super().__init__()
         self.synchronizer = MCPConfigSynchronizer()
         self.current_servers: Dict[str, MCPServer] = {}
         self.app_configs: Dict[str, Dict] = {}
-        self.selected_server: Optional[str] = None
+        # Server name -> displayed cells from the last table render; lets
+        # update_server_table mutate only the rows that actually changed
+        self._last_table_state: Dict[str, tuple] = {}
+        # App name -> ((mtime_ns, size) of its config file, server count);
+        # the same fingerprint the parse cache uses, so a recount happens
+        # exactly when the file changes on disk
+        self._server_counts: Dict[str, tuple] = {}
+        # Fixed pieces of the status panel; only the per-app state varies
+        # between refreshes
+        self._status_header = "📊 Application Status\n" + "=" * 50 + "\n"
+        self._refresh_timer = None
+        self._last_status_text = ""
+        self._write_seq = itertools.count()
+        self._status_sep = "\n" + "-" * 50
+        self._app_name_cells = {
+            app: f"📱 {app:<15}" for app in self.synchronizer.CONFIG_FILES
+        }
     
     def compose(self) -> ComposeResult:
         """Create the application layout."""
@@ -498,6 +540,16 @@ class MCPManagerApp(App):
     
     def on_mount(self) -> None:
         """Initialize the application when mounted."""
+        # Cache the widgets the refresh paths touch; query_one walks the
+        # DOM on every call and these are hit per refresh
+        self._server_table = self.query_one("#server_table", DataTable)
+        self._status_text_widget = self.query_one("#status_text", Static)
+        self._status_display = self.query_one("#app_status_display", Static)
+        self._selected_display = self.query_one("#selected_server_display", Static)
+        # Columns are fixed; add them once instead of on every table update
+        self._server_table.add_column("Name", key="name")
+        self._server_table.add_column("Command", key="command")
+        self._server_table.add_column("Args", key="args")
         self.refresh_data()
         # Set initial focus to app list
         self.query_one("#app_list").focus()
@@ -507,20 +559,29 @@ class MCPManagerApp(App):
     
     def refresh_data(self) -> None:
         """Refresh all data from configuration files."""
+        self._refresh_timer = None
+        self._last_status_text = ""
         self.load_app_configs()
         self.load_current_servers()
         self.update_server_table()
         self.update_app_status()
     
+    def _schedule_refresh(self) -> None:
+        """Coalesce bursts of refresh requests into a single pass."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+        self._refresh_timer = self.set_timer(0.05, self.refresh_data)
+    
     def load_app_configs(self) -> None:
         """Load configurations from all application files."""
-        self.app_configs = {}
-        for app_name, config_path in self.synchronizer.CONFIG_FILES.items():
-            if config_path.exists():
-                config = self.synchronizer.load_existing_config(config_path)
-                if config is not None:
-                    self.app_configs[app_name] = config
-                    
+        # _load_all reads every config concurrently on the core I/O pool,
+        # so a cold refresh pays the slowest read instead of the sum
+        loaded = self.synchronizer._load_all()
+        self.app_configs = {
+            app_name: config
+            for app_name, config_path in self.synchronizer.CONFIG_FILES.items()
+            if (config := loaded.get(app_name)) is not None and config_path.exists()
+        }
         self.update_status(f"Loaded configs from {len(self.app_configs)} applications")
     
     def load_current_servers(self) -> None:
@@ -538,27 +599,31 @@ class MCPManagerApp(App):
     
     def update_server_table(self) -> None:
         """Update the server table with current server data."""
-        table = self.query_one("#server_table", DataTable)
-        table.clear(columns=True)
-        
-        # Add columns
-        table.add_column("Name", key="name")
-        table.add_column("Command", key="command")
-        table.add_column("Args", key="args")
+        table = self._server_table
         
-        # Add rows and store mapping
+        # Diff against the previous render and touch only changed rows
+        # rather than rebuilding the whole table
+        new_state = {}
         for server in self.current_servers.values():
             args_display = " ".join(server.args[:2]) + ("..." if len(server.args) > 2 else "")
-            table.add_row(
-                server.name,
-                server.command[:20] + ("..." if len(server.command) > 20 else ""),
-                args_display,
-                key=server.name
-            )
-        
-        # Clear selection when table is updated
+            command_display = server.command[:20] + ("..." if len(server.command) > 20 else "")
+            new_state[server.name] = (server.name, command_display, args_display)
+        
+        old_state = self._last_table_state
+        for name in old_state.keys() - new_state.keys():
+            table.remove_row(name)
+        for name, cells in new_state.items():
+            old_cells = old_state.get(name)
+            if old_cells is None:
+                table.add_row(*cells, key=name)
+            elif old_cells != cells:
+                for column_key, value in zip(("name", "command", "args"), cells):
+                    table.update_cell(name, column_key, value)
+        self._last_table_state = new_state
+        
+        # Clear selection when table is updated; the reactive watcher
+        # refreshes the display only if this is a real change
         self.selected_server = None
-        self._update_selected_server_display()
     
     def update_app_status(self) -> None:
         """Update the application status display."""
@@ -566,33 +631,44 @@ class MCPManagerApp(App):
         all_in_sync, validation_results = self.synchronizer.validate_configs()
         
         # Build status text using plain text formatting
-        status_lines = ["📊 Application Status\n" + "=" * 50 + "\n"]
+        status_lines = [self._status_header]
         
         for app_name, config_path in self.synchronizer.CONFIG_FILES.items():
-            if config_path.exists():
+            try:
+                st = config_path.stat()
+            except OSError:
+                st = None
+            if st is not None:
                 validation = validation_results.get(app_name, {})
                 in_sync = validation.get('in_sync', False)
                 format_name = validation.get('format', 'Unknown')
-                
-                # Count servers
-                if app_name in self.app_configs:
-                    config = self.app_configs[app_name]
-                    handler = self.synchronizer.detect_config_format(config)
-                    mcp_config = handler.extract_mcp_config(config)
-                    server_count = len(mcp_config.get('servers', {}))
-                else:
+
+                # Count servers, re-extracting only when the file's
+                # fingerprint changed since the last refresh
+                config = self.app_configs.get(app_name)
+                if config is None:
                     server_count = 0
+                else:
+                    fingerprint = (st.st_mtime_ns, st.st_size)
+                    cached = self._server_counts.get(app_name)
+                    if cached is not None and cached[0] == fingerprint:
+                        server_count = cached[1]
+                    else:
+                        handler = self.synchronizer.detect_config_format(config)
+                        mcp_config = handler.extract_mcp_config(config)
+                        server_count = len(mcp_config.get('servers', {}))
+                        self._server_counts[app_name] = (fingerprint, server_count)
                 
                 status_icon = "✅" if in_sync else "⚠️"
                 status_text = "Synced" if in_sync else "Out of sync"
                 
                 status_lines.append(
-                    f"📱 {app_name:<15} {status_icon} {status_text:<12} "
+                    f"{self._app_name_cells[app_name]} {status_icon} {status_text:<12} "
                     f"Servers: {server_count:<3} Format: {format_name}"
                 )
             else:
                 status_lines.append(
-                    f"📱 {app_name:<15} ❌ Missing      "
+                    f"{self._app_name_cells[app_name]} ❌ Missing      "
                     f"Servers: 0   Format: —"
                 )
         
@@ -601,17 +677,19 @@ class MCPManagerApp(App):
         synced_apps = sum(1 for v in validation_results.values() if v.get('in_sync', False))
         
         status_lines.extend([
-            "\n" + "-" * 50,
+            self._status_sep,
             f"Summary: {synced_apps}/{total_apps} applications synchronized"
         ])
         
-        status_display = self.query_one("#app_status_display", Static)
-        status_display.update("\n".join(status_lines))
+        # Re-render only when the panel content actually changed
+        new_text = "\n".join(status_lines)
+        if new_text != self._last_status_text:
+            self._last_status_text = new_text
+            self._status_display.update(new_text)
     
     def update_status(self, message: str) -> None:
         """Update the status bar with a message."""
-        status_text = self.query_one("#status_text", Static)
-        status_text.update(message)
+        self._status_text_widget.update(message)
     
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         """Handle application selection changes."""
@@ -638,14 +716,12 @@ class MCPManagerApp(App):
             row_key = table.get_row_key_at(cursor_row)
             if row_key:
                 self.selected_server = str(row_key)
-                self._update_selected_server_display()
                 return
             
             # Fallback: get the first column value (server name)
             row_data = table.get_row_at(cursor_row)
             if row_data and len(row_data) > 0:
                 self.selected_server = str(row_data[0])
-                self._update_selected_server_display()
                 return
                 
         except Exception as e:
@@ -653,6 +729,9 @@ class MCPManagerApp(App):
         
         # If all else fails
         self.selected_server = None
+    
+    def watch_selected_server(self, selected_server: Optional[str]) -> None:
+        """React to selection changes; runs once per real change."""
         self._update_selected_server_display()
     
     def _update_selected_server_display(self) -> None:
@@ -664,11 +743,7 @@ class MCPManagerApp(App):
             message = "No server selected"
             self.update_status("No server selected")
         
-        try:
-            selected_display = self.query_one("#selected_server_display", Static)
-            selected_display.update(message)
-        except Exception:
-            pass
+        self._selected_display.update(message)
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press events."""
@@ -747,13 +822,50 @@ class MCPManagerApp(App):
         # Merge with existing config
         updated_config = handler.merge_mcp_config(existing_config, mcp_config)
         
-        # Save to file
-        config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(config_path, 'w') as f:
-            json.dump(updated_config, f, indent=2)
-        
-        # Update cached config
+        # Update the cached config immediately so the UI reflects the
+        # change; the disk write happens off-thread
         self.app_configs[self.current_app] = updated_config
+        self._write_config(config_path, _dumps(updated_config))
+    
+    def _write_config(self, config_path: Path, payload: bytes) -> None:
+        """Write a config file atomically without blocking the UI."""
+        # One exclusive worker group per config path: a newer save of the
+        # same file supersedes a queued one, but saves of different files
+        # never cancel each other
+        self.run_worker(
+            partial(self._write_config_blocking, config_path, payload),
+            thread=True,
+            exclusive=True,
+            group=f"config-write:{config_path}",
+        )
+
+    async def action_quit(self) -> None:
+        """Flush queued config writes, then exit."""
+        # Shutdown cancels workers that haven't started yet, so a save
+        # followed by a prompt quit could silently drop the write after
+        # the UI already reported it saved; wait the write groups out
+        # before letting the app tear down
+        pending = [
+            worker for worker in self.workers
+            if worker.group.startswith("config-write:")
+        ]
+        for worker in pending:
+            try:
+                await worker.wait()
+            except WorkerCancelled:
+                # Superseded by a newer save of the same file
+                pass
+        self.exit()
+
+    def _write_config_blocking(self, config_path: Path, payload: bytes) -> None:
+        # The temp+rename keeps readers from ever seeing a torn file; the
+        # per-write sequence number keeps concurrent workers for different
+        # paths from colliding on a temp name
+        config_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = config_path.with_suffix(
+            config_path.suffix + f'.tmp.{os.getpid()}.{next(self._write_seq)}')
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, config_path)
     
     def action_sync_all(self) -> None:
         """Sync the current application's servers to all other applications."""
@@ -766,22 +878,28 @@ class MCPManagerApp(App):
             "servers": {name: server.to_dict() for name, server in self.current_servers.items()}
         }
         
-        # Update synchronizer and sync
+        # The per-app writes run off-thread; results come back via
+        # call_from_thread so the event loop never blocks on disk
+        self._sync_all_worker(sync_config)
+    
+    @work(thread=True, exclusive=True, group="sync")
+    def _sync_all_worker(self, sync_config: Dict) -> None:
+        """Run the sync-all operation off the UI thread."""
         self.synchronizer.config = sync_config
         sync_results = self.synchronizer.update_configs()
-        
-        # Show results
         success_count = sum(1 for result in sync_results.values() if result.get('success', False))
-        total_count = len(sync_results)
-        
+        self.call_from_thread(self._finish_sync_all, success_count, len(sync_results))
+    
+    def _finish_sync_all(self, success_count: int, total_count: int) -> None:
+        """Report sync results and refresh (UI thread)."""
         self.notify(f"Sync completed: {success_count}/{total_count} apps updated")
-        self.refresh_data()
+        self._schedule_refresh()
     
     def action_sync_configs(self) -> None:
         """Open the sync configuration screen."""
         def handle_result(sync_results: Optional[Dict]) -> None:
             if sync_results:
-                self.refresh_data()
+                self._schedule_refresh()
         
         self.push_screen(SyncScreen(self.synchronizer, self.current_servers), handle_result)
     
@@ -0,0 +1,86 @@
+"""Regression tests for mcp_core synchronization behavior."""
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from mcp_core import MCPConfigSynchronizer
+
+
+def make_synchronizer(config_files):
+    """Build a synchronizer pointed at test-controlled config paths."""
+    sync = MCPConfigSynchronizer()
+    sync.CONFIG_FILES = dict(config_files)
+    sync._config_items = tuple(sync.CONFIG_FILES.items())
+    sync._ensured_dirs = set()
+    return sync
+
+
+class VSCodeSyncTest(unittest.TestCase):
+    """Syncing into a VSCode-format settings.json must reach the disk."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory(prefix="mcp-test-")
+        self.addCleanup(self._tmp.cleanup)
+        self.settings_path = Path(self._tmp.name) / "settings.json"
+        self.settings_path.write_text(json.dumps({
+            "editor.fontSize": 12,
+            "mcp": {
+                "servers": {"old": {"command": "old-cmd"}},
+                "inputs": []
+            }
+        }))
+        self.sync = make_synchronizer({"VSCode": self.settings_path})
+
+    def read_servers(self):
+        return json.loads(self.settings_path.read_text())["mcp"]["servers"]
+
+    def test_changed_servers_reach_disk_twice(self):
+        # First sync replaces the existing server set
+        self.sync.config = {"servers": {"first": {"command": "a"}}}
+        results = self.sync.update_configs(force=True)
+        self.assertTrue(results["VSCode"]["success"])
+        self.assertEqual(self.read_servers(), {"first": {"command": "a"}})
+
+        # Second sync with different servers must hit the disk again, not
+        # be skipped as unchanged (regression: the VSCode handler mutated
+        # the existing config in place, so the changed-content check
+        # always saw equal dicts and skipped the write)
+        self.sync.config = {"servers": {"second": {"command": "b"}}}
+        results = self.sync.update_configs(force=True)
+        self.assertTrue(results["VSCode"]["success"])
+        self.assertNotEqual(results["VSCode"]["action"], "unchanged")
+        self.assertEqual(self.read_servers(), {"second": {"command": "b"}})
+
+    def test_non_mcp_settings_preserved(self):
+        self.sync.config = {"servers": {"first": {"command": "a"}}}
+        self.sync.update_configs(force=True)
+        data = json.loads(self.settings_path.read_text())
+        self.assertEqual(data["editor.fontSize"], 12)
+
+
+class ParseCacheIsolationTest(unittest.TestCase):
+    """Cache hits must not hand out the cache-resident dict itself."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory(prefix="mcp-test-")
+        self.addCleanup(self._tmp.cleanup)
+        self.config_path = Path(self._tmp.name) / "config.json"
+        self.config_path.write_text(json.dumps({
+            "mcp": {"servers": {"git": {"command": "uvx"}}}
+        }))
+        self.sync = make_synchronizer({"Cursor": self.config_path})
+
+    def test_caller_mutation_does_not_poison_cache(self):
+        first = self.sync.load_existing_config(self.config_path)
+        first["mcp"]["servers"]["evil"] = {"command": "x"}
+        second = self.sync.load_existing_config(self.config_path)
+        self.assertNotIn("evil", second["mcp"]["servers"])
+        self.assertIsNot(first, second)
+
+
+if __name__ == "__main__":
+    unittest.main()